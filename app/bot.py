@@ -2,24 +2,30 @@
 import discord
 from discord.ext import commands
 import asyncio
+from typing import Optional
 from app.config import *
 from app.db.db_manager import DatabaseManager
 from app.db.migrations.migrate import MigrationManager
 from app.sheets.sheets_manager import SheetsManager
 from app.utils.logger import logger
+from app.utils.loop_monitor import monitor_loop_lag
 
 class Bot(commands.Bot):
     def __init__(self):
         intents = discord.Intents.default()
-        intents.message_content = True
+        # Needed for guild.get_member display names in the checkout views
         intents.members = True
         intents.guilds = True
         
         super().__init__(command_prefix=COMMAND_PREFIX, intents=intents)
         self.sheets = SheetsManager()
         self.db = DatabaseManager(DB_URL) # type: ignore
+        self._loop_monitor: Optional[asyncio.Task] = None
     
     async def setup_hook(self):
+        # Flags anything that stalls the gateway loop, e.g. a blocking client call
+        self._loop_monitor = asyncio.create_task(monitor_loop_lag())
+
         await self.db.connect()
         
         if GOOGLE_SERVICE_ACCOUNT_FILE:
@@ -29,12 +35,16 @@ class Bot(commands.Bot):
 
         logger.info("Running database migrations...")
         migrator = MigrationManager(DB_URL) # type: ignore
-        await migrator.run_migrations()
-        
-        await self.load_extension('app.cogs.inventory')
-        await self.load_extension('app.cogs.checkout')
-        await self.load_extension('app.cogs.admin')
-        await self.load_extension('app.cogs.general')
+        # Migrations use their own connection, so run them alongside cog
+        # loading; gathering them together means a failed migration
+        # aborts startup before commands are synced.
+        await asyncio.gather(
+            migrator.run_migrations(),
+            self.load_extension('app.cogs.inventory'),
+            self.load_extension('app.cogs.checkout'),
+            self.load_extension('app.cogs.admin'),
+            self.load_extension('app.cogs.general'),
+        )
         
         # Sync slash commands
         if GUILD_ID:
@@ -48,7 +58,7 @@ class Bot(commands.Bot):
     
     async def on_ready(self):
         logger.info(f'🤖 {self.user} is online!')
-        if not GUILD_ID:
+        if not GUILD_ID and CLEAR_GUILD_COMMANDS:
             logger.info("Scrubbing old guild commands to fix duplicates...")
             for guild in self.guilds:
                 self.tree.clear_commands(guild=guild)
@@ -67,12 +77,23 @@ class Bot(commands.Bot):
             return
         
         logger.info("Checking for guilds without spreadsheets.")
-        for guild in self.guilds:
-            settings = await self.db.get_guild_settings(guild.id)
-            
-            if not settings or not settings.google_sheet_id:
+        all_settings = await asyncio.gather(
+            *(self.db.get_guild_settings(guild.id) for guild in self.guilds)
+        )
+
+        # Bounded so a cold start doesn't burst through the Sheets write quota
+        semaphore = asyncio.Semaphore(SHEETS_SETUP_CONCURRENCY)
+
+        async def create_sheet(guild: discord.Guild):
+            async with semaphore:
                 await self.create_sheet_for_guild(guild)
 
+        await asyncio.gather(*(
+            create_sheet(guild)
+            for guild, settings in zip(self.guilds, all_settings)
+            if not settings or not settings.google_sheet_id
+        ))
+
     async def on_guild_join(self, guild: discord.Guild):
         logger.info(f"Joined new guild: {guild.name} (ID: {guild.id})")
 
@@ -95,38 +116,50 @@ class Bot(commands.Bot):
                 await self.sheets.make_sheet_public(spreadsheet)
                 logger.info(f"Sheet for {guild.name} is now publicly viewable")
             
-            for channel in guild.text_channels:
-                if channel.permissions_for(guild.me).send_messages:
-                    embed = discord.Embed(
-                        title="Inventory Tracking Sheet Created!",
-                        description="A Google Sheet has been created to track this server's inventory.",
-                        color=discord.Color.green()
-                    )
-                    embed.add_field(
-                        name="View Your Inventory",
-                        value=f"[Click here to view the sheet]({sheet_url})",
-                        inline=False
-                    )
-                    embed.add_field(
-                        name="Auto-Sync",
-                        value="The sheet automatically updates when you add items, check out equipment, etc.",
-                        inline=False
-                    )
-                    embed.add_field(
-                        name="Commands",
-                        value="• `/sheetinfo` - View sheet link\n• `/syncsheets` - Manually sync data",
-                        inline=False
-                    )
-                    
-                    await channel.send(embed=embed)
-                    break
+            embed = discord.Embed(
+                title="Inventory Tracking Sheet Created!",
+                description="A Google Sheet has been created to track this server's inventory.",
+                color=discord.Color.green()
+            )
+            embed.add_field(
+                name="View Your Inventory",
+                value=f"[Click here to view the sheet]({sheet_url})",
+                inline=False
+            )
+            embed.add_field(
+                name="Auto-Sync",
+                value="The sheet automatically updates when you add items, check out equipment, etc.",
+                inline=False
+            )
+            embed.add_field(
+                name="Commands",
+                value="• `/sheetinfo` - View sheet link\n• `/syncsheets` - Manually sync data",
+                inline=False
+            )
+
+            channel = self._find_announcement_channel(guild)
+            if channel:
+                await channel.send(embed=embed)
             
         except Exception as e:
             logger.error(f"Failed to create sheet for {guild.name}: {e}")
 
+    def _find_announcement_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
+        system_channel = guild.system_channel
+        if system_channel and system_channel.permissions_for(guild.me).send_messages:
+            return system_channel
+
+        for channel in guild.text_channels:
+            if channel.permissions_for(guild.me).send_messages:
+                return channel
+
+        return None
+
     async def on_guild_remove(self, guild: discord.Guild):
         logger.info(f"Left guild: {guild.name} (ID: {guild.id})")
 
     async def close(self):
+        if self._loop_monitor:
+            self._loop_monitor.cancel()
         await self.db.close()
         await super().close()
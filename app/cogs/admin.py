@@ -3,6 +3,7 @@ from typing import Optional
 import discord
 from discord import app_commands
 from discord.ext import commands
+from app.config import ADMIN_LIST_LIMIT
 from app.db.db_manager import DatabaseManager
 from app.utils.logger import logger
 
@@ -13,16 +14,15 @@ class Admin(commands.Cog):
 
     # TODO: Fix
     async def interaction_check(self, interaction: discord.Interaction) -> bool:  # type: ignore[override]        
-        if not isinstance(interaction.user, discord.Member):
+        if not interaction.guild_id or not isinstance(interaction.user, discord.Member):
             return False
         
+        # Resolved from the permissions bitmask sent with the interaction, no DB needed
         if interaction.permissions.administrator:
             return True
-        
-        if not interaction.guild_id:
-            return False
 
         is_admin = await self.db.is_admin(interaction.guild_id, interaction.user.id)
+        interaction.extras["is_bot_admin"] = is_admin
         
         if not is_admin:
             await interaction.response.send_message(
@@ -52,9 +52,6 @@ class Admin(commands.Cog):
             )
             return
         
-        await self.db.ensure_guild_member(guild_id, interaction.user.id, interaction.user.name)
-        await self.db.ensure_guild_member(guild_id, user.id, user.name)
-
         if user.guild_permissions.administrator and not admin:
             await interaction.response.send_message(
                 "You can not revoke admin from a server admin.", 
@@ -62,7 +59,14 @@ class Admin(commands.Cog):
             )
             return
 
-        await self.db.set_admin(guild_id, user.id, admin)
+        await self.db.apply_admin_change(
+            guild_id,
+            interaction.user.id,
+            interaction.user.name,
+            user.id,
+            user.name,
+            admin
+        )
 
         embed = discord.Embed(
             title="Admin Permissions Updated",
@@ -96,9 +100,9 @@ class Admin(commands.Cog):
             )
             return
 
-        admins = await self.db.get_guild_admins(guild_id)
+        admin_ids, total = await self.db.get_guild_admin_user_ids(guild_id, ADMIN_LIST_LIMIT)
         
-        if not admins:
+        if not admin_ids:
             await interaction.response.send_message(
                 "No bot admins set for this server. Server administrators can use `/setadmin` to add admins.",
                 ephemeral=True
@@ -108,10 +112,12 @@ class Admin(commands.Cog):
         embed = discord.Embed(
             title=f"Bot Admins for {interaction.guild.name}",
             color=discord.Color.blue(),
-            description=f"Total: {len(admins)} admin(s)"
+            description=f"Total: {total} admin(s)"
         )
         
-        admin_list = "\n".join([f"• <@{admin.user_id}>" for admin in admins])
+        admin_list = "\n".join(f"• <@{uid}>" for uid in admin_ids)
+        if total > len(admin_ids):
+            admin_list += f"\n... and {total - len(admin_ids)} more"
         
         embed.add_field(name="Admins", value=admin_list, inline=False)
         embed.set_footer(text="Note: Discord server administrators also have bot admin access")
@@ -143,7 +149,10 @@ class Admin(commands.Cog):
             return
         
         is_discord_admin = target_user.guild_permissions.administrator
-        is_bot_admin = await self.db.is_admin(guild_id, target_user.id)
+        if target_user.id == interaction.user.id and "is_bot_admin" in interaction.extras:
+            is_bot_admin = interaction.extras["is_bot_admin"]
+        else:
+            is_bot_admin = await self.db.is_admin(guild_id, target_user.id)
         
         embed = discord.Embed(
             title=f"🔍 Admin Status: {target_user.name}",
@@ -213,11 +222,16 @@ class Admin(commands.Cog):
                 )
                 return
         
-        await self.bot.sheets.full_sync(self.db, guild_id)
+        if not self.bot.sheets.start_full_sync(self.db, guild_id):
+            await interaction.followup.send(
+                "A sync is already in progress for this server.",
+                ephemeral=True
+            )
+            return
         
         embed = discord.Embed(
-            title="Google Sheet Synced",
-            description="Inventory data has been updated",
+            title="Google Sheet Sync Started",
+            description="Inventory data is being updated in the background",
             color=discord.Color.green()
         )
         embed.add_field(
@@ -226,7 +240,7 @@ class Admin(commands.Cog):
             inline=False
         )
         
-        await interaction.followup.send(embed=embed)
+        await interaction.edit_original_response(embed=embed)
 
 async def setup(bot):
     await bot.add_cog(Admin(bot, bot.db))
@@ -3,10 +3,11 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pydantic import ValidationError
 
 from app.bot import Bot
+from app.config import MAX_ITEM_QUANTITY
 from app.cogs.views.all_checkouts_view import AllCheckoutsView
 from app.cogs.views.my_checkouts_view import MyCheckoutsView
 from app.db.db_manager import DatabaseManager
@@ -28,40 +29,25 @@ class Checkout(commands.Cog):
         self,
         interaction: discord.Interaction,
         item_id: int,
-        quantity: int,
-        days: Optional[int] = None,
+        quantity: app_commands.Range[int, 1, MAX_ITEM_QUANTITY],
+        days: Optional[app_commands.Range[int, 1]] = None,
         notes: Optional[str] = None
     ):
         await interaction.response.defer()
         
-        await self.db.ensure_user_exists(interaction.user.id, interaction.user.name)
-        
         guild_id = interaction.guild_id
 
         if not guild_id:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Could not detect server.", 
                 ephemeral=True
             )
             return
 
-        item = await self.db.get_item(guild_id, item_id)
-        if not item:
-            await interaction.followup.send("Item not found", ephemeral=True)
-            return
-        
-        if item.quantity_available < quantity:
-            await interaction.followup.send(
-                f"Not enough available!\n"
-                f"**{item.item_name}** - Available: {item.quantity_available}, Requested: {quantity}",
-                ephemeral=True
-            )
-            return
-        
         try:
             expected_return = None
             if days:
-                expected_return = datetime.now() + timedelta(days=days)
+                expected_return = datetime.now(timezone.utc) + timedelta(days=days)
             
             request = CheckoutRequest(
                 item_id=item_id,
@@ -70,27 +56,30 @@ class Checkout(commands.Cog):
                 notes=notes
             )
 
-            guild_id = interaction.guild_id
-
-            if not guild_id:
-                await interaction.response.send_message(
-                    "Could not detect server.", 
-                    ephemeral=True
-                )
-                return
-            
-            checkout = await self.db.checkout_item(request, guild_id, interaction.user.id)
+            checkout = await self.db.checkout_item(
+                request, guild_id, interaction.user.id, interaction.user.name
+            )
             
             if not checkout:
-                await interaction.followup.send("Checkout failed", ephemeral=True)
+                # Only the failure path needs the item, to say why
+                item = await self.db.get_item(guild_id, item_id)
+                if not item:
+                    await interaction.followup.send("Item not found", ephemeral=True)
+                    return
+
+                await interaction.followup.send(
+                    f"Not enough available!\n"
+                    f"**{item.item_name}** - Available: {item.quantity_available}, Requested: {quantity}",
+                    ephemeral=True
+                )
                 return
             
             embed = discord.Embed(
                 title="Item Checked Out",
                 color=discord.Color.green(),
-                timestamp=datetime.now()
+                timestamp=datetime.now(timezone.utc)
             )
-            embed.add_field(name="Item", value=item.item_name, inline=True)
+            embed.add_field(name="Item", value=checkout.item_name, inline=True)
             embed.add_field(name="Quantity", value=str(quantity), inline=True)
             embed.add_field(name="Checkout ID", value=str(checkout.id), inline=True)
             
@@ -106,16 +95,19 @@ class Checkout(commands.Cog):
             
             embed.add_field(
                 name="Remaining Available",
-                value=f"{item.quantity_available - quantity} / {item.quantity_total}",
+                value=f"{checkout.remaining_available} / {checkout.item_quantity_total}",
                 inline=True
             )
             
             embed.set_footer(text=f"Checked out by {interaction.user.name}")
             
-            await interaction.followup.send(embed=embed)
+            await interaction.edit_original_response(embed=embed)
             
         except ValidationError as e:
-            errors = "\n".join([f"• {err['loc'][0]}: {err['msg']}" for err in e.errors()])
+            errors = "\n".join(
+                f"• {'.'.join(map(str, err['loc']))}: {err['msg']}"
+                for err in e.errors(include_url=False, include_input=False)
+            )
             await interaction.followup.send(
                 f"**Validation Error:**\n{errors}",
                 ephemeral=True
@@ -148,11 +140,11 @@ class Checkout(commands.Cog):
             title="Item Returned",
             description=f"Checkout ID: {checkout_id}",
             color=discord.Color.green(),
-            timestamp=datetime.now()
+            timestamp=datetime.now(timezone.utc)
         )
         embed.set_footer(text=f"Returned by {interaction.user.name}")
         
-        await interaction.followup.send(embed=embed)
+        await interaction.edit_original_response(embed=embed)
     
     @app_commands.command(name="mycheckouts", description="View your active checkouts")
     async def my_checkouts(self, interaction: discord.Interaction):
@@ -163,22 +155,17 @@ class Checkout(commands.Cog):
             await interaction.followup.send("Could not detect server.", ephemeral=True)
             return
 
-        checkouts = await self.db.get_active_checkouts(guild_id, interaction.user.id)
+        checkouts = await self.db.get_active_checkouts_with_items(guild_id, interaction.user.id)
 
         if not checkouts:
-            await interaction.followup.send("You have no active checkouts.")
+            await interaction.edit_original_response(content="You have no active checkouts.")
             return
 
-        item_ids = {co.item_id for co in checkouts}
-        items_by_id = {}
-        for item_id in item_ids:
-            item = await self.db.get_item(guild_id, item_id)
-            if item:
-                items_by_id[item_id] = item.item_name
+        items_by_id = {co.item_id: co.item_name for co in checkouts}
 
         view = MyCheckoutsView(checkouts, items_by_id, self.db)
         embed = view.create_embed(interaction.user.display_name)
-        await interaction.followup.send(embed=embed, view=view)
+        await interaction.edit_original_response(embed=embed, view=view)
     
     @app_commands.command(name="allcheckouts", description="View all active checkouts")
     async def all_checkouts(self, interaction: discord.Interaction):
@@ -194,29 +181,24 @@ class Checkout(commands.Cog):
             await interaction.followup.send("This command must be used in a server.", ephemeral=True)
             return
         
-        checkouts = await self.db.get_active_checkouts(guild_id)
+        checkouts = await self.db.get_active_checkouts_with_items(guild_id)
         
         if not checkouts:
-            await interaction.followup.send("No active checkouts!")
+            await interaction.edit_original_response(content="No active checkouts!")
             return
         
         user_checkouts = {}
+        items_by_id = {}
         for checkout in checkouts:
             if checkout.user_id not in user_checkouts:
                 user_checkouts[checkout.user_id] = []
             user_checkouts[checkout.user_id].append(checkout)
-        
-        item_ids = {co.item_id for co in checkouts}
-        items_by_id = {}
-        for item_id in item_ids:
-            item = await self.db.get_item(guild_id, item_id)
-            if item:
-                items_by_id[item_id] = item.item_name
+            items_by_id[checkout.item_id] = checkout.item_name
         
         view = AllCheckoutsView(user_checkouts, items_by_id, interaction.guild)
         embed = view.create_embed()
         
-        await interaction.followup.send(embed=embed, view=view)
+        await interaction.edit_original_response(embed=embed, view=view)
 
 async def setup(bot):
     await bot.add_cog(Checkout(bot, bot.db))
@@ -1,5 +1,6 @@
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from typing import Optional
 
 import discord
@@ -8,12 +9,18 @@ from discord import app_commands
 from pydantic import ValidationError
 
 from app.bot import Bot
+from app.config import INVENTORY_PAGE_SIZE, MAX_ITEM_QUANTITY
 from app.cogs.views.delete_confirmation_view import DeleteConfirmationView
 from app.cogs.views.inventory_paginated_view import InventoryPaginatedView
 from app.cogs.views.item_details_view import ItemDetailsView
 from app.db.db_manager import DatabaseManager
 from app.db.models import CreateItemRequest, Subteam, UpdateItemRequest
 
+_SUBTEAM_CHOICES = [
+    app_commands.Choice(name=member.value.title(), value=member.value)
+    for member in Subteam
+]
+
 class Inventory(commands.Cog):
     def __init__(self, bot: Bot, db_manager: DatabaseManager):
         self.bot = bot
@@ -29,28 +36,18 @@ class Inventory(commands.Cog):
         purchase_order="Discord PO thread link (preferred) or PO number",
         description="Optional description"
     )
-    @app_commands.choices(
-        subteam=[
-            app_commands.Choice(name=member.value.title(), value=member.value)
-            for member in Subteam
-        ]
-    )
+    @app_commands.choices(subteam=_SUBTEAM_CHOICES)
     async def add_item(
         self,
         interaction: discord.Interaction,
         item_name: str,
-        quantity: int,
+        quantity: app_commands.Range[int, 1, MAX_ITEM_QUANTITY],
         location: str,
         subteam: str,
         point_of_contact: discord.Member,
         purchase_order: str,
         description: Optional[str] = None
     ):
-        await interaction.response.defer()
-
-        await self.db.ensure_user_exists(interaction.user.id, interaction.user.name)
-        await self.db.ensure_user_exists(point_of_contact.id, point_of_contact.name)
-
         guild_id = interaction.guild_id
 
         if not guild_id:
@@ -60,6 +57,8 @@ class Inventory(commands.Cog):
             )
             return
 
+        # Validate before deferring: the success embed is public, but a deferred
+        # public response can't be turned into an ephemeral error afterwards
         try:
             request = CreateItemRequest(
                 item_name=item_name,
@@ -70,34 +69,47 @@ class Inventory(commands.Cog):
                 purchase_order=purchase_order,
                 description=description
             )
-
-            item = await self.db.add_item(request, guild_id, interaction.user.id)
-
-            embed = discord.Embed(
-                title="Item Added to Inventory",
-                color=discord.Color.green(),
-                timestamp=datetime.now()
-            )
-            embed.add_field(name="Item", value=item.item_name, inline=True)
-            embed.add_field(name="Quantity", value=str(item.quantity_total), inline=True)
-            embed.add_field(name="Location", value=item.location, inline=True)
-            embed.add_field(name="Subteam", value=item.subteam, inline=True)
-            embed.add_field(name="Point of Contact", value=f"<@{item.point_of_contact}>", inline=True)
-            embed.add_field(name="Purchase Order", value=item.purchase_order, inline=True)
-
-            if item.description:
-                embed.add_field(name="Description", value=item.description, inline=False)
-            
-            embed.set_footer(text=f"Item ID: {item.id} - Added by {interaction.user.name}")
-
-            await interaction.followup.send(embed=embed)
-
         except ValidationError as e:
-            errors = "\n".join([f"• {err['loc'][0]}: {err['msg']}" for err in e.errors()])
-            await interaction.followup.send(
+            errors = "\n".join(
+                f"• {'.'.join(map(str, err['loc']))}: {err['msg']}"
+                for err in e.errors(include_url=False, include_input=False)
+            )
+            await interaction.response.send_message(
                 f"**Validation Error:**\n{errors}",
                 ephemeral=True
             )
+            return
+
+        await interaction.response.defer()
+
+        item = await self.db.add_item(
+            request,
+            guild_id,
+            interaction.user.id,
+            users=[
+                (interaction.user.id, interaction.user.name),
+                (point_of_contact.id, point_of_contact.name),
+            ],
+        )
+
+        embed = discord.Embed(
+            title="Item Added to Inventory",
+            color=discord.Color.green(),
+            timestamp=datetime.now(timezone.utc)
+        )
+        embed.add_field(name="Item", value=item.item_name, inline=True)
+        embed.add_field(name="Quantity", value=str(item.quantity_total), inline=True)
+        embed.add_field(name="Location", value=item.location, inline=True)
+        embed.add_field(name="Subteam", value=item.subteam, inline=True)
+        embed.add_field(name="Point of Contact", value=f"<@{item.point_of_contact}>", inline=True)
+        embed.add_field(name="Purchase Order", value=item.purchase_order, inline=True)
+
+        if item.description:
+            embed.add_field(name="Description", value=item.description, inline=False)
+        
+        embed.set_footer(text=f"Item ID: {item.id} - Added by {interaction.user.name}")
+
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="inventory", description="View inventory items")
     @app_commands.describe(
@@ -105,12 +117,7 @@ class Inventory(commands.Cog):
         subteam="Filter by subteam",
         location="Filter by location"
     )
-    @app_commands.choices(
-        subteam=[
-            app_commands.Choice(name=member.value.title(), value=member.value)
-            for member in Subteam
-        ]
-    )
+    @app_commands.choices(subteam=_SUBTEAM_CHOICES)
     async def view_inventory(
         self,
         interaction: discord.Interaction,
@@ -129,39 +136,43 @@ class Inventory(commands.Cog):
             )
             return
 
-        items = await self.db.search_items(guild_id, search, subteam, location)
+        items, total = await self.db.search_items_page(
+            guild_id, search, subteam, location, limit=INVENTORY_PAGE_SIZE
+        )
 
         if not items:
             await interaction.followup.send("No items found with your criteria")
             return
 
-        view = InventoryPaginatedView(items, self.db)
-        embed = view.create_embed(0)
+        view = InventoryPaginatedView(items, total, self.db, guild_id, search, subteam, location)
+        embed = await view.create_embed(0)
 
         await interaction.followup.send(embed=embed, view=view)
 
     @app_commands.command(name="itemdetails", description="View detailed info about an item")
     @app_commands.describe(item_id="The item ID to view")
     async def item_details(self, interaction: discord.Interaction, item_id: int):
-        await interaction.response.defer()
+        await interaction.response.defer(ephemeral=True)
 
         guild_id = interaction.guild_id
 
         if not guild_id:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Could not detect server.", 
                 ephemeral=True
             )
             return
 
-        item = await self.db.get_item(guild_id, item_id)
+        # Independent lookups; the extra checkouts query on a missing item is cheap
+        item, checkouts = await asyncio.gather(
+            self.db.get_item(guild_id, item_id),
+            self.db.get_item_checkouts(guild_id, item_id, active_only=True),
+        )
 
         if not item:
             await interaction.followup.send("Item not found", ephemeral=True)
             return
 
-        checkouts = await self.db.get_item_checkouts(guild_id, item_id, active_only=True)
-
         embed = discord.Embed(
             title=item.item_name,
             color=discord.Color.blue(),
@@ -200,7 +211,7 @@ class Inventory(commands.Cog):
         
         embed.set_footer(text=f"Last updated")
 
-        view = ItemDetailsView(item, await self.db.get_active_checkouts(guild_id), self.db)
+        view = ItemDetailsView(item, checkouts, self.db)
         
         await interaction.followup.send(embed=embed, view=view)
 
@@ -215,30 +226,25 @@ class Inventory(commands.Cog):
         purchase_order="New PO (optional)",
         description="New description (optional)"
     )
-    @app_commands.choices(
-        subteam=[
-            app_commands.Choice(name=member.value.title(), value=member.value)
-            for member in Subteam
-        ]
-    )
+    @app_commands.choices(subteam=_SUBTEAM_CHOICES)
     async def edit_item(
         self,
         interaction: discord.Interaction,
         item_id: int,
         item_name: Optional[str] = None,
-        quantity: Optional[int] = None,
+        quantity: Optional[app_commands.Range[int, 0, MAX_ITEM_QUANTITY]] = None,
         location: Optional[str] = None,
         subteam: Optional[str] = None,
         point_of_contact: Optional[discord.Member] = None,
         purchase_order: Optional[str] = None,
         description: Optional[str] = None
     ):
-        await interaction.response.defer()
+        await interaction.response.defer(ephemeral=True)
 
         guild_id = interaction.guild_id
 
         if not guild_id:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Could not detect server.", 
                 ephemeral=True
             )
@@ -260,10 +266,13 @@ class Inventory(commands.Cog):
                 description=description
             )
 
-            if point_of_contact:
-                await self.db.ensure_user_exists(point_of_contact.id, point_of_contact.name)
-            
-            updated_item = await self.db.update_item(guild_id, item_id, request, interaction.user.id)
+            updated_item = await self.db.update_item(
+                guild_id,
+                item_id,
+                request,
+                interaction.user.id,
+                users=[(point_of_contact.id, point_of_contact.name)] if point_of_contact else None,
+            )
 
             if not updated_item:
                 await interaction.followup.send("Failed to update item", ephemeral=True)
@@ -275,19 +284,20 @@ class Inventory(commands.Cog):
                 color=discord.Color.green()
             )
 
-            changes = []
-            if item_name and item_name != item.item_name:
-                changes.append(f"Name: {item.item_name} → {item_name}")
-            if location and location != item.location:
-                changes.append(f"Location: {item.location} → {location}")
-            if quantity and quantity != item.quantity_total:
-                changes.append(f"Quantity: {item.quantity_total} → {quantity}")
-            if subteam and subteam != item.subteam:
-                changes.append(f"Subteam: {item.subteam} → {subteam}")
-            if point_of_contact and point_of_contact.id != item.point_of_contact:
-                changes.append(f"POC: <@{item.point_of_contact}> → <@{point_of_contact.id}>")
-            if purchase_order and purchase_order != item.purchase_order:
-                changes.append(f"PO: {item.purchase_order} → {purchase_order}")
+            diffs = (
+                ("Name", item.item_name, item_name, str),
+                ("Location", item.location, location, str),
+                ("Quantity", item.quantity_total, quantity, str),
+                ("Subteam", item.subteam.value, subteam, str),
+                ("POC", item.point_of_contact, point_of_contact.id if point_of_contact else None, "<@{}>".format),
+                ("PO", item.purchase_order, purchase_order, str),
+            )
+            # `is not None` so a quantity of 0 still shows up as a change
+            changes = [
+                f"{label}: {fmt(old)} → {fmt(new)}"
+                for label, old, new, fmt in diffs
+                if new is not None and new != old
+            ]
             
             if changes:
                 embed.add_field(name="Changes", value="\n".join(changes), inline=False)
@@ -297,7 +307,10 @@ class Inventory(commands.Cog):
             await interaction.followup.send(embed=embed)
 
         except ValidationError as e:
-            errors = "\n".join([f"• {err['loc'][0]}: {err['msg']}" for err in e.errors()])
+            errors = "\n".join(
+                f"• {'.'.join(map(str, err['loc']))}: {err['msg']}"
+                for err in e.errors(include_url=False, include_input=False)
+            )
             await interaction.followup.send(
                 f"**Validation Error:**\n{errors}",
                 ephemeral=True
@@ -308,23 +321,25 @@ class Inventory(commands.Cog):
     @app_commands.command(name="deleteitem", description="Delete an item from inventory")
     @app_commands.describe(item_id="The item ID to delete")
     async def delete_item(self, interaction: discord.Interaction, item_id: int):
-        await interaction.response.defer()
+        await interaction.response.defer(ephemeral=True)
 
         guild_id = interaction.guild_id
 
         if not guild_id:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Could not detect server.", 
                 ephemeral=True
             )
             return
 
-        item = await self.db.get_item(guild_id, item_id)
+        item, checkouts = await asyncio.gather(
+            self.db.get_item(guild_id, item_id),
+            self.db.get_item_checkouts(guild_id, item_id, active_only=True),
+        )
         if not item:
             await interaction.followup.send("Item not found", ephemeral=True)
             return
         
-        checkouts = await self.db.get_item_checkouts(guild_id, item_id, active_only=True)
         if checkouts:
             await interaction.followup.send(
                 f"Cannot delete **{item.item_name}** - it has {len(checkouts)} active checkout(s)!\n"
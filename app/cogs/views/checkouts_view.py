@@ -130,8 +130,6 @@ class CheckoutModal(discord.ui.Modal, title="Checkout Item"):
             quantity = int(self.quantity.value)
             days_value = int(self.days.value) if self.days.value else None
 
-            await self.db.ensure_user_exists(interaction.user.id, interaction.user.name)
-
             expected_return = None
             if days_value:
                 expected_return = datetime.now(timezone.utc) + timedelta(days=days_value)
@@ -143,7 +141,9 @@ class CheckoutModal(discord.ui.Modal, title="Checkout Item"):
                 notes=self.notes.value or None,
             )
 
-            checkout = await self.db.checkout_item(request, interaction.guild_id, interaction.user.id)
+            checkout = await self.db.checkout_item(
+                request, interaction.guild_id, interaction.user.id, interaction.user.name
+            )
 
             if not checkout:
                 await interaction.followup.send(
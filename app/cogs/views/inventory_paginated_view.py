@@ -1,26 +1,49 @@
+from typing import Optional
+
 import discord
 
+from app.config import INVENTORY_PAGE_SIZE
 from app.db.models import Item
 
 
 class InventoryPaginatedView(discord.ui.View):
-    def __init__(self, items: list[Item], db_manager, items_per_page = 5):
+    def __init__(
+        self,
+        first_page: list[Item],
+        total: int,
+        db_manager,
+        guild_id: int,
+        search: Optional[str] = None,
+        subteam: Optional[str] = None,
+        location: Optional[str] = None,
+    ):
         super().__init__(timeout=300)
-        self.items = items
         self.db = db_manager
+        self.guild_id = guild_id
+        self.filters = (search, subteam, location)
+        self.total = total
         self.current_page = 0
-        self.items_per_page = items_per_page
-        self.max_pages = max((len(items) - 1) // self.items_per_page + 1, 1)
+        self.items_per_page = INVENTORY_PAGE_SIZE
+        self.max_pages = max((total - 1) // self.items_per_page + 1, 1)
+        # Only the visited pages are fetched; each is rendered once and reused when flipping back
+        self._embeds: dict[int, discord.Embed] = {0: self._build_embed(0, first_page)}
 
         if self.max_pages <= 1:
             self.previous_button.disabled = True
             self.next_button.disabled = True
 
-    def create_embed(self, page: int) -> discord.Embed:
-        start = page * self.items_per_page
-        end = start + self.items_per_page
-        page_items = self.items[start:end]
+    async def create_embed(self, page: int) -> discord.Embed:
+        if page not in self._embeds:
+            page_items, _ = await self.db.search_items_page(
+                self.guild_id,
+                *self.filters,
+                limit=self.items_per_page,
+                offset=page * self.items_per_page,
+            )
+            self._embeds[page] = self._build_embed(page, page_items)
+        return self._embeds[page]
 
+    def _build_embed(self, page: int, page_items: list[Item]) -> discord.Embed:
         embed = discord.Embed(
             title="Inventory",
             color=discord.Color.from_rgb(47, 49, 54),
@@ -52,9 +75,8 @@ class InventoryPaginatedView(discord.ui.View):
                 inline=False,
             )
 
-        total = len(self.items)
         embed.set_footer(
-            text=f"Page {page + 1}/{self.max_pages}  ·  {total} item{'s' if total != 1 else ''}"
+            text=f"Page {page + 1}/{self.max_pages}  ·  {self.total} item{'s' if self.total != 1 else ''}"
         )
 
         return embed
@@ -66,7 +88,7 @@ class InventoryPaginatedView(discord.ui.View):
             self.previous_button.disabled = self.current_page == 0
             self.next_button.disabled = False
             await interaction.response.edit_message(
-                embed=self.create_embed(self.current_page), view=self
+                embed=await self.create_embed(self.current_page), view=self
             )
         else:
             await interaction.response.defer()
@@ -78,7 +100,7 @@ class InventoryPaginatedView(discord.ui.View):
             self.next_button.disabled = self.current_page == self.max_pages - 1
             self.previous_button.disabled = False
             await interaction.response.edit_message(
-                embed=self.create_embed(self.current_page), view=self
+                embed=await self.create_embed(self.current_page), view=self
             )
         else:
             await interaction.response.defer()
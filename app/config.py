@@ -8,9 +8,18 @@ DB_URL = os.getenv("DB_URL")
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 GUILD_ID = os.getenv("GUILD_ID")
 
+# One-shot cleanup of stale per-guild commands left over from GUILD_ID deployments
+CLEAR_GUILD_COMMANDS = os.getenv("CLEAR_GUILD_COMMANDS", "").lower() in ("1", "true")
+
 # User interface
 STATUS_MESSAGE = "There will be a day when I will be used for the last time. Scary."
 COMMAND_PREFIX = "!"
+# Upper bound Discord enforces on quantity options before the command reaches us
+MAX_ITEM_QUANTITY = 1_000_000
+# Items per /inventory page; each page is fetched from the database on demand
+INVENTORY_PAGE_SIZE = 5
+# Admins rendered by /listadmins; one embed field caps out at 1024 characters
+ADMIN_LIST_LIMIT = 25
 
 # Google Services
 GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE")
@@ -21,6 +30,30 @@ GOOGLE_API_SCOPES = [
 ]
 GOOGLE_TOKEN_PATH = os.getenv("GOOGLE_TOKEN_PATH")
 GOOGLE_CREDS_PATH = os.getenv("GOOGLE_CREDS_PATH")
+SHEETS_SETUP_CONCURRENCY = 5
+GOOGLE_HTTP_POOL_CONNECTIONS = 10
+GOOGLE_HTTP_POOL_MAXSIZE = 20
+
+# Caching
+ADMIN_CACHE_TTL_S = 30
+ADMIN_CACHE_MAX_ENTRIES = 1024
+ITEM_CACHE_TTL_S = 30
+ITEM_CACHE_MAX_ENTRIES = 512
+# Per-connection asyncpg prepared statement cache; 0 lifetime keeps hot statements from expiring
+DB_STATEMENT_CACHE_SIZE = 256
+DB_STATEMENT_CACHE_LIFETIME_S = 0
+
+# Database pool; each command holds one connection for a single statement and a
+# full sheets sync briefly holds three, so size for concurrent commands plus syncs
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_COMMAND_TIMEOUT_S = 60
+
+# Diagnostics
+LOOP_LAG_CHECK_INTERVAL_S = 1.0
+LOOP_LAG_WARN_S = 0.1
+# Waiting this long for a pooled connection means DB_POOL_MAX_SIZE is too small
+DB_POOL_ACQUIRE_WARN_S = 0.1
 
 # Web server
 WEB_SERVER_PORT=8080
@@ -1,18 +1,192 @@
 
 import asyncio
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from typing import List, Optional
 
 import asyncpg
-from app.db.models import AuditLog, Checkout, CheckoutRequest, CreateItemRequest, GuildPermission, GuildSettings, InventoryStats, Item, UpdateItemRequest, User
+from app.config import ADMIN_CACHE_MAX_ENTRIES, ADMIN_CACHE_TTL_S, DB_COMMAND_TIMEOUT_S, DB_POOL_ACQUIRE_WARN_S, DB_POOL_MAX_SIZE, DB_POOL_MIN_SIZE, DB_STATEMENT_CACHE_LIFETIME_S, DB_STATEMENT_CACHE_SIZE, ITEM_CACHE_MAX_ENTRIES, ITEM_CACHE_TTL_S
+from app.db.models import AuditLog, Checkout, CheckoutReceipt, CheckoutRequest, CheckoutWithItem, CreateItemRequest, GuildPermission, GuildSettings, InventoryStats, Item, UpdateItemRequest, User
 from app.error.exceptions import DatabaseNotInitializedError
 from app.sheets.sheets_manager import SheetsManager
 from app.utils.logger import logger
 
+def _upsert_users_cte(ids_param: str, names_param: str) -> str:
+    # Shared users upsert for writes that also need their users to exist; pair with _dedupe_members
+    return f"""
+        upserted_users AS (
+            INSERT INTO users (user_id, username)
+            SELECT * FROM UNNEST({ids_param}::bigint[], {names_param}::text[])
+            ON CONFLICT (user_id)
+            DO UPDATE SET username = EXCLUDED.username
+        )
+    """
+
+
+# Hot queries run on nearly every interaction. asyncpg prepares each distinct SQL
+# string once per connection and reuses it from its statement cache, so keep these
+# texts in one place to make every call site hit the same cached statement.
+_GET_USER_PERMISSIONS_SQL = "SELECT * FROM guild_permissions WHERE user_id = $1 AND guild_id = $2"
+_GET_ITEM_SQL = "SELECT * FROM items WHERE id = $1 AND guild_id = $2"
+_GET_ACTIVE_CHECKOUTS_SQL = """
+    SELECT * FROM checkouts
+    WHERE guild_id = $1 AND returned_at IS NULL
+    ORDER BY checked_out_at DESC
+"""
+_GET_USER_ACTIVE_CHECKOUTS_SQL = """
+    SELECT * FROM checkouts
+    WHERE guild_id = $1 AND user_id = $2 AND returned_at IS NULL
+    ORDER BY checked_out_at DESC
+"""
+
+# Write statements that splice in the users CTE are assembled once here rather
+# than re-formatted on every call, so each call passes the same string object.
+_ENSURE_GUILD_MEMBERS_SQL = f"""
+    WITH {_upsert_users_cte("$2", "$3")}
+    INSERT INTO guild_permissions (user_id, guild_id, is_admin)
+    SELECT user_id, $1, FALSE FROM UNNEST($2::bigint[]) AS user_id
+    ON CONFLICT (guild_id, user_id) DO NOTHING
+"""
+# The target row is written by the outer upsert only; a statement can't touch a row twice
+_APPLY_ADMIN_CHANGE_SQL = f"""
+    WITH {_upsert_users_cte("$2", "$3")},
+    upserted_members AS (
+        INSERT INTO guild_permissions (user_id, guild_id, is_admin)
+        SELECT member_id, $1, FALSE FROM UNNEST($2::bigint[]) AS member_id
+        WHERE member_id <> $4
+        ON CONFLICT (guild_id, user_id) DO NOTHING
+    )
+    INSERT INTO guild_permissions (guild_id, user_id, is_admin)
+    VALUES ($1, $4, $5)
+    ON CONFLICT (guild_id, user_id)
+    DO UPDATE SET is_admin = $5, updated_at = NOW()
+"""
+_ADD_ITEM_SQL = f"""
+    WITH {_upsert_users_cte("$9", "$10")},
+    inserted AS (
+        INSERT INTO items (
+            guild_id, item_name, quantity_total, quantity_available,
+            location, subteam, point_of_contact, purchase_order, description
+        )
+        VALUES ($1, $2, $3, $3, $4, $5, $6, $7, $8)
+        RETURNING *
+    ),
+    logged AS (
+        INSERT INTO audit_log (guild_id, user_id, action, item_id, details)
+        SELECT $1, $11, 'add_item', id, 'Added ' || $3 || 'x ' || item_name
+        FROM inserted
+    )
+    SELECT * FROM inserted
+"""
+_ADD_ITEMS_SQL = f"""
+    WITH {_upsert_users_cte("$9", "$10")},
+    inserted AS (
+        INSERT INTO items (
+            guild_id, item_name, quantity_total, quantity_available,
+            location, subteam, point_of_contact, purchase_order, description
+        )
+        SELECT
+            $1, u.item_name, u.quantity, u.quantity,
+            u.location, u.subteam::subteam_type, u.point_of_contact,
+            u.purchase_order, u.description
+        FROM UNNEST(
+            $2::text[], $3::int[], $4::text[], $5::text[],
+            $6::bigint[], $7::text[], $8::text[]
+        ) WITH ORDINALITY AS u(
+            item_name, quantity, location, subteam,
+            point_of_contact, purchase_order, description, ord
+        )
+        ORDER BY u.ord
+        RETURNING *
+    ),
+    logged AS (
+        INSERT INTO audit_log (guild_id, user_id, action, item_id, details)
+        SELECT $1, $11, 'add_item', id, 'Added ' || quantity_total || 'x ' || item_name
+        FROM inserted
+    )
+    SELECT * FROM inserted ORDER BY id
+"""
+# NULL leaves a column as it is, and the checked-out guard sits in the WHERE clause
+_UPDATE_ITEM_SQL = f"""
+    WITH {_upsert_users_cte("$10", "$11")},
+    updated AS (
+        UPDATE items SET
+            item_name = COALESCE($3, item_name),
+            quantity_total = COALESCE($4, quantity_total),
+            quantity_available = COALESCE(
+                $4 - (quantity_total - quantity_available), quantity_available
+            ),
+            location = COALESCE($5, location),
+            subteam = COALESCE($6::subteam_type, subteam),
+            point_of_contact = COALESCE($7, point_of_contact),
+            purchase_order = COALESCE($8, purchase_order),
+            description = COALESCE($9, description)
+        WHERE id = $1 AND guild_id = $2
+            AND ($4::int IS NULL OR $4 >= quantity_total - quantity_available)
+        RETURNING *
+    ),
+    logged AS (
+        INSERT INTO audit_log (guild_id, user_id, action, item_id, details)
+        SELECT $2, $12, 'edit_item', id, $13 FROM updated
+    )
+    SELECT * FROM updated
+"""
+
+
+def _item_filters(
+    guild_id: int,
+    search: Optional[str],
+    subteam: Optional[str],
+    location: Optional[str]
+) -> tuple[str, list]:
+    clauses = ["guild_id = $1"]
+    params: list = [guild_id]
+
+    if search:
+        params.append(f"%{search}%")
+        clauses.append(f"item_name ILIKE ${len(params)}")
+
+    if subteam:
+        params.append(subteam)
+        clauses.append(f"subteam = ${len(params)}")
+
+    if location:
+        params.append(location)
+        clauses.append(f"location = ${len(params)}")
+
+    return " AND ".join(clauses), params
+
+
+def _store_with_ttl(cache: dict, key, value, ttl_s: float, max_entries: int):
+    now = time.monotonic()
+    if len(cache) >= max_entries:
+        for expired in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+            del cache[expired]
+        if len(cache) >= max_entries:
+            cache.clear()
+
+    cache[key] = (now + ttl_s, value)
+
+
+def _dedupe_members(members: list[tuple[int, str]]) -> tuple[list[int], list[str]]:
+    # One row per user, in id order, so concurrent upserts always lock rows in the same order
+    usernames = dict(members)
+    user_ids = sorted(usernames)
+    return user_ids, [usernames[uid] for uid in user_ids]
+
+
 class DatabaseManager:
     def __init__(self, db_url: str):
         self.db_url = db_url
         self.pool = None
         self.sheets_manager = None
+        self._admin_cache: dict[tuple[int, int], tuple[float, bool]] = {}
+        self._admin_generation = 0
+        self._item_cache: dict[tuple[int, int], tuple[float, Item]] = {}
+        self._item_generation = 0
+        self._settings_cache: dict[int, GuildSettings] = {}
+        self._settings_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     def set_sheets_manager(self, sheets_manager: SheetsManager):
         self.sheets_manager = sheets_manager
@@ -20,13 +194,27 @@ class DatabaseManager:
     async def connect(self):
         self.pool = await asyncpg.create_pool(
             self.db_url,
-            min_size=2,
-            max_size=10,
-            command_timeout=60
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            command_timeout=DB_COMMAND_TIMEOUT_S,
+            statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+            max_cached_statement_lifetime=DB_STATEMENT_CACHE_LIFETIME_S,
         )
         
         logger.info("Connected to database")
 
+    @asynccontextmanager
+    async def _acquire(self):
+        started = time.monotonic()
+        async with self.pool.acquire() as conn:
+            waited = time.monotonic() - started
+            if waited > DB_POOL_ACQUIRE_WARN_S:
+                logger.warning(
+                    f"Waited ~{waited * 1000:.0f} ms for a database connection "
+                    f"({self.pool.get_size()}/{self.pool.get_max_size()} open)"
+                )
+            yield conn
+
     async def close(self):
         if self.pool:
             await self.pool.close()
@@ -38,7 +226,7 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute("""
                 INSERT INTO users (user_id, username)
                 VALUES ($1, $2)
@@ -47,23 +235,22 @@ class DatabaseManager:
             """, user_id, username)
 
     async def ensure_guild_member(self, guild_id: int, user_id: int, username: str):
+        await self.ensure_guild_members(guild_id, [(user_id, username)])
+
+    async def ensure_guild_members(self, guild_id: int, members: list[tuple[int, str]]):
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            await self.ensure_user_exists(user_id, username)
+        user_ids, usernames = _dedupe_members(members)
 
-            await conn.execute("""
-                INSERT INTO guild_permissions (user_id, guild_id, is_admin)
-                VALUES ($1, $2, FALSE)
-                ON CONFLICT (guild_id, user_id) DO NOTHING
-            """, user_id, guild_id)
+        async with self._acquire() as conn:
+            await conn.execute(_ENSURE_GUILD_MEMBERS_SQL, guild_id, user_ids, usernames)
 
     async def get_user(self, user_id: int) -> Optional[User]:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             row = await conn.fetchrow(
                 "SELECT * from users where user_id = $1",
                 user_id
@@ -74,7 +261,7 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             rows = await conn.fetch(
                 "SELECT * FROM users where user_id = ANY($1)",
                 list(set(user_ids))
@@ -85,22 +272,38 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT * from guild_permissions where user_id = $1 AND guild_id = $2",
-                user_id, guild_id
-            )
+        async with self._acquire() as conn:
+            row = await conn.fetchrow(_GET_USER_PERMISSIONS_SQL, user_id, guild_id)
             return GuildPermission.from_record(row) if row else None
 
     async def is_admin(self, guild_id: int, user_id: int) -> bool:
+        key = (guild_id, user_id)
+        cached = self._admin_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        generation = self._admin_generation
         perms = await self.get_user_permissions(guild_id, user_id)
-        return perms.is_admin if perms else False
+        is_admin = perms.is_admin if perms else False
+
+        # An admin change committed while we were querying; our row may be stale
+        if generation == self._admin_generation:
+            self._store_admin_status(key, is_admin)
+
+        return is_admin
+
+    def _store_admin_status(self, key: tuple[int, int], is_admin: bool):
+        _store_with_ttl(self._admin_cache, key, is_admin, ADMIN_CACHE_TTL_S, ADMIN_CACHE_MAX_ENTRIES)
+
+    def _invalidate_admin_status(self, guild_id: int, user_id: int):
+        self._admin_generation += 1
+        self._admin_cache.pop((guild_id, user_id), None)
 
     async def set_admin(self, guild_id: int, user_id: int, is_admin: bool):
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                     INSERT INTO guild_permissions (guild_id, user_id, is_admin)
@@ -111,31 +314,62 @@ class DatabaseManager:
                 guild_id, user_id, is_admin
             )
 
-    async def get_guild_admins(self, guild_id: int) -> List[GuildPermission]:
+        self._invalidate_admin_status(guild_id, user_id)
+
+    async def apply_admin_change(
+        self,
+        guild_id: int,
+        invoker_id: int,
+        invoker_name: str,
+        user_id: int,
+        username: str,
+        is_admin: bool
+    ):
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        user_ids, usernames = _dedupe_members([(invoker_id, invoker_name), (user_id, username)])
+
+        async with self._acquire() as conn:
+            await conn.execute(_APPLY_ADMIN_CHANGE_SQL, guild_id, user_ids, usernames, user_id, is_admin)
+
+        self._invalidate_admin_status(guild_id, user_id)
+
+    async def get_guild_admin_user_ids(self, guild_id: int, limit: int) -> tuple[list[int], int]:
+        if not self.pool:
+            raise DatabaseNotInitializedError()
+        
+        async with self._acquire() as conn:
             rows = await conn.fetch('''
-                SELECT gp.*, u.username
+                SELECT gp.user_id, COUNT(*) OVER () AS total
                 FROM guild_permissions gp
                 JOIN users u ON gp.user_id = u.user_id
                 WHERE gp.guild_id = $1 AND gp.is_admin = TRUE
                 ORDER BY u.username
-            ''', guild_id)
-            return [GuildPermission.from_record(row) for row in rows]
+                LIMIT $2
+            ''', guild_id, limit)
+            return [row["user_id"] for row in rows], rows[0]["total"] if rows else 0
 
     # ===== Guild Settings =====
     async def get_guild_settings(self, guild_id: int) -> Optional[GuildSettings]:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        if guild_id in self._settings_cache:
+            return self._settings_cache[guild_id]
+
+        # Held across the query so a concurrent write can't be overwritten by a stale read
+        async with self._settings_locks[guild_id], self._acquire() as conn:
             row = await conn.fetchrow(
                 "SELECT * FROM guild_settings WHERE guild_id = $1",
                 guild_id
             )
-            return GuildSettings.from_record(row) if row else None
+            if not row:
+                return None
+
+            settings = GuildSettings.from_record(row)
+            self._settings_cache[guild_id] = settings
+            return settings
     
     async def upsert_guild_settings(
         self,
@@ -147,7 +381,7 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._settings_locks[guild_id], self._acquire() as conn:
             row = await conn.fetchrow("""
                 INSERT INTO guild_settings (guild_id, guild_name, google_sheet_id, google_sheet_url)
                 VALUES ($1, $2, $3, $4)
@@ -160,35 +394,44 @@ class DatabaseManager:
                 RETURNING *
             """, guild_id, guild_name, google_sheet_id, google_sheet_url)
             
-            return GuildSettings.from_record(row)
+            settings = GuildSettings.from_record(row)
+            self._settings_cache[guild_id] = settings
+            return settings
     
     async def set_guild_sheet(self, guild_id: int, sheet_id: str, sheet_url: str):
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            await conn.execute("""
+        async with self._settings_locks[guild_id], self._acquire() as conn:
+            row = await conn.fetchrow("""
                 INSERT INTO guild_settings (guild_id, guild_name, google_sheet_id, google_sheet_url)
                 VALUES ($1, 'Unknown', $2, $3)
                 ON CONFLICT (guild_id)
                 DO UPDATE SET google_sheet_id = $2, google_sheet_url = $3, updated_at = NOW()
+                RETURNING *
             """, guild_id, sheet_id, sheet_url)
 
+            self._settings_cache[guild_id] = GuildSettings.from_record(row)
+
     # ===== Item =====
 
-    async def add_item(self, request: CreateItemRequest, guild_id, added_by: int) -> Item:
+    async def add_item(
+        self,
+        request: CreateItemRequest,
+        guild_id,
+        added_by: int,
+        users: Optional[list[tuple[int, str]]] = None
+    ) -> Item:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("""
-                INSERT INTO items (
-                    guild_id, item_name, quantity_total, quantity_available,
-                    location, subteam, point_of_contact, purchase_order, description
-                )
-                VALUES ($1, $2, $3, $3, $4, $5, $6, $7, $8)
-                RETURNING *
-            """,
+        # Upserting the creator/POC and writing the audit entry in the same
+        # statement saves a round trip each
+        user_ids, usernames = _dedupe_members(users or [])
+
+        async with self._acquire() as conn:
+            row = await conn.fetchrow(
+                _ADD_ITEM_SQL,
                 guild_id,
                 request.item_name,
                 request.quantity,
@@ -196,30 +439,81 @@ class DatabaseManager:
                 request.subteam,
                 request.point_of_contact,
                 request.purchase_order,
-                request.description
+                request.description,
+                user_ids,
+                usernames,
+                added_by
             )
 
             item = Item.from_record(row)
 
-            await self.log_action(
-                guild_id, added_by, "add_item", item.id,
-                f"Added {request.quantity}x {request.item_name}"
+            self.trigger_sheets_sync(guild_id)
+
+            return item
+
+
+    async def add_items(
+        self,
+        requests: list[CreateItemRequest],
+        guild_id: int,
+        added_by: int,
+        users: Optional[list[tuple[int, str]]] = None
+    ) -> List[Item]:
+        if not self.pool:
+            raise DatabaseNotInitializedError()
+
+        if not requests:
+            return []
+
+        # One UNNEST insert and one audit batch instead of an add_item round trip per row
+        user_ids, usernames = _dedupe_members(users or [])
+
+        async with self._acquire() as conn:
+            rows = await conn.fetch(
+                _ADD_ITEMS_SQL,
+                guild_id,
+                [r.item_name for r in requests],
+                [r.quantity for r in requests],
+                [r.location for r in requests],
+                [r.subteam for r in requests],
+                [r.point_of_contact for r in requests],
+                [r.purchase_order for r in requests],
+                [r.description for r in requests],
+                user_ids,
+                usernames,
+                added_by
             )
 
             self.trigger_sheets_sync(guild_id)
 
-            return item
+            return [Item.from_record(row) for row in rows]
+
 
     async def get_item(self, guild_id: int, item_id: int) -> Optional[Item]:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT * from items WHERE id = $1 AND guild_id = $2",
-                item_id, guild_id
-            )    
-            return Item.from_record(row) if row else None
+        key = (guild_id, item_id)
+        cached = self._item_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        generation = self._item_generation
+        async with self._acquire() as conn:
+            row = await conn.fetchrow(_GET_ITEM_SQL, item_id, guild_id)
+
+        if not row:
+            return None
+
+        item = Item.from_record(row)
+        # Same race guard as is_admin: skip caching a read that overlapped a write
+        if generation == self._item_generation:
+            _store_with_ttl(self._item_cache, key, item, ITEM_CACHE_TTL_S, ITEM_CACHE_MAX_ENTRIES)
+        return item
+
+    def _invalidate_item(self, guild_id: int, item_id: int):
+        self._item_generation += 1
+        self._item_cache.pop((guild_id, item_id), None)
 
     async def search_items(
         self,
@@ -231,92 +525,99 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            query = 'SELECT * FROM items WHERE guild_id = $1'
-            params = [guild_id]
-            param_count = 1
-            
-            if search:
-                param_count += 1
-                query += f' AND item_name ILIKE ${param_count}'
-                params.append(f'%{search}%') # type: ignore
-            
-            if subteam:
-                param_count += 1
-                query += f' AND subteam = ${param_count}'
-                params.append(subteam) # type: ignore
-            
-            if location:
-                param_count += 1
-                query += f' AND location = ${param_count}'
-                params.append(location) # type: ignore
-            
-            query += ' ORDER BY item_name'
+        async with self._acquire() as conn:
+            where, params = _item_filters(guild_id, search, subteam, location)
+            query = f'SELECT * FROM items WHERE {where} ORDER BY item_name'
             
             rows = await conn.fetch(query, *params)
             return [Item.from_record(row) for row in rows]    
 
+    async def search_items_page(
+        self,
+        guild_id: int,
+        search: Optional[str] = None,
+        subteam: Optional[str] = None,
+        location: Optional[str] = None,
+        *,
+        limit: int,
+        offset: int = 0
+    ) -> tuple[List[Item], int]:
+        if not self.pool:
+            raise DatabaseNotInitializedError()
+        
+        async with self._acquire() as conn:
+            where, params = _item_filters(guild_id, search, subteam, location)
+            # The window count rides along with the page, saving a separate COUNT(*) query
+            query = f'''
+                SELECT *, COUNT(*) OVER () AS total_matches
+                FROM items WHERE {where}
+                ORDER BY item_name, id
+                LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+            '''
+            
+            rows = await conn.fetch(query, *params, limit, offset)
+            total = rows[0]["total_matches"] if rows else 0
+            return [Item.from_record(row) for row in rows], total
+
     async def update_item(
         self,
         guild_id: int,
         item_id: int,
         request: UpdateItemRequest,
-        updated_by: int
+        updated_by: int,
+        users: Optional[list[tuple[int, str]]] = None
     ) -> Optional[Item]:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            updates = request.model_dump(exclude_unset=True, exclude_none=True)
-
-            if not updates:
-                return await self.get_item(guild_id, item_id)
-            
-            set_clauses = []
-            params = [item_id, guild_id]
-            param_count = 2
+        updates = request.model_dump(exclude_unset=True, exclude_none=True)
 
-            for k, v in updates.items():
-                param_count += 1
-                set_clauses.append(f"{k} = ${param_count}")
-                params.append(v)
+        # Checked before acquiring so a no-op edit doesn't hold one pooled
+        # connection while get_item waits on another
+        if not updates:
+            return await self.get_item(guild_id, item_id)
 
-            if "quantity_total" in updates:
-                current = await conn.fetchrow(
-                    "SELECT quantity_total, quantity_available FROM items WHERE id = $1 AND guild_id = $2",
-                    item_id, guild_id
-                )
-                
-                if current:
-                    checked_out = current["quantity_total"] - current["quantity_available"]
-                    new_total = updates["quantity_total"]
-                    
-                    if new_total < checked_out:
-                        raise ValueError(
-                            f"Cannot set total to {new_total}. There are {checked_out} items currently checked out."
-                        )
-                
-                param_count += 1
-                set_clauses.append(
-                    f"quantity_available = ${param_count} - (quantity_total - quantity_available)"
-                )
-                params.append(updates["quantity_total"])
+        changes = ', '.join(f"{k}={v}" for k, v in updates.items())
+        user_ids, usernames = _dedupe_members(users or [])
 
-            query = f"UPDATE items SET {', '.join(set_clauses)} WHERE id = $1 AND guild_id = $2 RETURNING *"
-            row = await conn.fetchrow(query, *params)
+        async with self._acquire() as conn:
+            row = await conn.fetchrow(
+                _UPDATE_ITEM_SQL,
+                item_id,
+                guild_id,
+                request.item_name,
+                request.quantity_total,
+                request.location,
+                request.subteam,
+                request.point_of_contact,
+                request.purchase_order,
+                request.description,
+                user_ids,
+                usernames,
+                updated_by,
+                f"Updated: {changes}"
+            )
+            self._invalidate_item(guild_id, item_id)
 
             if row:
                 item = Item.from_record(row)
 
-                changes = ', '.join(f"{k}={v}" for k, v in updates.items())
-                await self.log_action(
-                    guild_id, updated_by, "edit_item", item.id,
-                    f"Updated: {changes}"
-                )
-
                 self.trigger_sheets_sync(guild_id)
 
                 return item
+
+            # Only reached on a miss, so the happy path stays one round trip
+            if request.quantity_total is not None:
+                current = await conn.fetchrow(
+                    "SELECT quantity_total, quantity_available FROM items WHERE id = $1 AND guild_id = $2",
+                    item_id, guild_id
+                )
+
+                if current:
+                    checked_out = current["quantity_total"] - current["quantity_available"]
+                    raise ValueError(
+                        f"Cannot set total to {request.quantity_total}. There are {checked_out} items currently checked out."
+                    )
             
         return None
     
@@ -324,19 +625,26 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            item = await self.get_item(guild_id, item_id)
+        async with self._acquire() as conn:
+            # ON DELETE SET NULL clears audit_log.item_id for a deleted item, so the
+            # entry is written without it up front
+            deleted = await conn.fetchval("""
+                WITH deleted AS (
+                    DELETE FROM items
+                    WHERE id = $1 AND guild_id = $2
+                    RETURNING item_name
+                ),
+                logged AS (
+                    INSERT INTO audit_log (guild_id, user_id, action, item_id, details)
+                    SELECT $2, $3, 'delete_item', NULL, 'Deleted ' || item_name
+                    FROM deleted
+                )
+                SELECT EXISTS (SELECT 1 FROM deleted)
+            """, item_id, guild_id, deleted_by)
+            self._invalidate_item(guild_id, item_id)
 
-            if not item:
+            if not deleted:
                 return False
-            
-            # Need to log before deleting to avoid violating fkey constraint
-            await self.log_action(
-                guild_id, deleted_by, "delete_item", item_id,
-                f"Deleted {item.item_name}"
-            )
-
-            await conn.execute("DELETE from items WHERE id = $1", item_id)
 
             self.trigger_sheets_sync(guild_id)
 
@@ -348,48 +656,64 @@ class DatabaseManager:
         self,
         request: CheckoutRequest,
         guild_id: int,
-        user_id: int
-    ):
+        user_id: int,
+        username: Optional[str] = None
+    ) -> Optional[CheckoutReceipt]:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            async with conn.transaction():
-                item_row = await conn.fetchrow(
-                    "SELECT quantity_available, item_name FROM items WHERE id = $1 AND guild_id = $2 FOR UPDATE",
-                    request.item_id, guild_id
-                )
-
-                if not item_row or item_row["quantity_available"] < request.quantity:
-                    return None
-                
-                checkout_row = await conn.fetchrow("""
-                        INSERT INTO checkouts (
-                            item_id, guild_id, user_id, quantity, expected_return_date, notes
-                        )
-                        VALUES ($1, $2, $3, $4, $5, $6)
-                        RETURNING *
-                    """,
-                    request.item_id,
-                    guild_id,
-                    user_id,
-                    request.quantity,
-                    request.expected_return_date,
-                    request.notes
-                )
-
-                await conn.execute("""
+        async with self._acquire() as conn:
+            # The availability check and the reservation are one conditional UPDATE,
+            # so no row comes back when the item is missing or short on stock.
+            # Passing username also upserts the borrower, and the audit entry is
+            # written off the same reservation, all in one round trip.
+            row = await conn.fetchrow("""
+                WITH upserted_user AS (
+                    INSERT INTO users (user_id, username)
+                    SELECT $3, $7 WHERE $7::text IS NOT NULL
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET username = EXCLUDED.username
+                ),
+                reserved AS (
                     UPDATE items
-                    SET quantity_available = quantity_available - $2
-                    WHERE id = $1
-                """, request.item_id, request.quantity)
+                    SET quantity_available = quantity_available - $4
+                    WHERE id = $1 AND guild_id = $2 AND quantity_available >= $4
+                    RETURNING id, item_name, quantity_available, quantity_total
+                ),
+                inserted AS (
+                    INSERT INTO checkouts (
+                        item_id, guild_id, user_id, quantity, expected_return_date, notes
+                    )
+                    SELECT id, $2, $3, $4, $5, $6 FROM reserved
+                    RETURNING *
+                ),
+                logged AS (
+                    INSERT INTO audit_log (guild_id, user_id, action, item_id, details)
+                    SELECT $2, $3, 'checkout', id, 'Checked out ' || $4 || 'x ' || item_name
+                    FROM reserved
+                )
+                SELECT
+                    inserted.*,
+                    reserved.item_name,
+                    reserved.quantity_available AS remaining_available,
+                    reserved.quantity_total AS item_quantity_total
+                FROM inserted
+                JOIN reserved ON reserved.id = inserted.item_id
+            """,
+                request.item_id,
+                guild_id,
+                user_id,
+                request.quantity,
+                request.expected_return_date,
+                request.notes,
+                username
+            )
 
-                checkout = Checkout.from_record(checkout_row)
+            if not row:
+                return None
 
-            await self.log_action(
-                guild_id, user_id, "checkout", request.item_id,
-                f"Checked out {request.quantity}x {item_row["item_name"]}"
-            )
+            self._invalidate_item(guild_id, request.item_id)
+            checkout = CheckoutReceipt.from_record(row)
 
             self.trigger_sheets_sync(guild_id)
 
@@ -399,35 +723,35 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
-            async with conn.transaction():
-                checkout_row = await conn.fetchrow("""
-                    SELECT c.*, i.item_name
-                    FROM checkouts c
-                    JOIN items i ON c.item_id = i.id
-                    WHERE c.id = $1 AND c.guild_id = $2 AND c.returned_at IS NULL
-                    FOR UPDATE
-                """, checkout_id, guild_id)
-
-                if not checkout_row:
-                    return False
-                
-                await conn.execute("""
+        async with self._acquire() as conn:
+            # `returned_at IS NULL` is rechecked after a concurrent return releases
+            # the row lock, so a checkout can only be restocked once
+            item_id = await conn.fetchval("""
+                WITH returned AS (
                     UPDATE checkouts
                     SET returned_at = NOW()
-                    WHERE id = $1 AND guild_id = $2
-                """, checkout_id, guild_id)
-
-                await conn.execute("""
+                    WHERE id = $1 AND guild_id = $2 AND returned_at IS NULL
+                    RETURNING item_id, quantity
+                ),
+                restocked AS (
                     UPDATE items
-                    SET quantity_available = quantity_available + $3
-                    WHERE id = $1 AND guild_id = $2
-                """, checkout_row["item_id"], guild_id, checkout_row["quantity"])
+                    SET quantity_available = items.quantity_available + returned.quantity
+                    FROM returned
+                    WHERE items.id = returned.item_id AND items.guild_id = $2
+                    RETURNING items.id, items.item_name, returned.quantity
+                ),
+                logged AS (
+                    INSERT INTO audit_log (guild_id, user_id, action, item_id, details)
+                    SELECT $2, $3, 'return', id, 'Returned ' || quantity || 'x ' || item_name
+                    FROM restocked
+                )
+                SELECT id FROM restocked
+            """, checkout_id, guild_id, returned_by)
 
-            await self.log_action(
-                guild_id, returned_by, "return", checkout_row["item_id"],
-                f"Returned {checkout_row["quantity"]}x {checkout_row["item_name"]}"
-            )
+            if item_id is None:
+                return False
+
+            self._invalidate_item(guild_id, item_id)
 
             self.trigger_sheets_sync(guild_id)
 
@@ -437,27 +761,47 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
+            if user_id:
+                rows = await conn.fetch(_GET_USER_ACTIVE_CHECKOUTS_SQL, guild_id, user_id)
+            else:
+                rows = await conn.fetch(_GET_ACTIVE_CHECKOUTS_SQL, guild_id)
+
+            return [Checkout.from_record(row) for row in rows]
+        
+    async def get_active_checkouts_with_items(
+        self,
+        guild_id: int,
+        user_id: Optional[int] = None
+    ) -> List[CheckoutWithItem]:
+        if not self.pool:
+            raise DatabaseNotInitializedError()
+        
+        async with self._acquire() as conn:
             if user_id:
                 rows = await conn.fetch("""
-                    SELECT * FROM checkouts
-                    WHERE guild_id = $1 AND user_id = $2 AND returned_at IS NULL
-                    ORDER BY checked_out_at DESC
+                    SELECT c.*, i.item_name
+                    FROM checkouts c
+                    JOIN items i ON c.item_id = i.id
+                    WHERE c.guild_id = $1 AND c.user_id = $2 AND c.returned_at IS NULL
+                    ORDER BY c.checked_out_at DESC
                 """, guild_id, user_id)
             else:
                 rows = await conn.fetch("""
-                    SELECT * FROM checkouts
-                    WHERE guild_id = $1 AND returned_at IS NULL
-                    ORDER BY checked_out_at DESC
+                    SELECT c.*, i.item_name
+                    FROM checkouts c
+                    JOIN items i ON c.item_id = i.id
+                    WHERE c.guild_id = $1 AND c.returned_at IS NULL
+                    ORDER BY c.checked_out_at DESC
                 """, guild_id)
 
-            return [Checkout.from_record(row) for row in rows]
+            return [CheckoutWithItem.from_record(row) for row in rows]
         
     async def get_item_checkouts(self, guild_id: int, item_id: int, active_only: bool = False) -> List[Checkout]:
         if not self.pool:
             raise DatabaseNotInitializedError()
 
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             if active_only:
                 query = """
                     SELECT * FROM checkouts
@@ -480,10 +824,10 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             row = await conn.fetchrow("""
                 SELECT
-                    COUNT(DISTINCT id) as total_items,
+                    COUNT(*) as total_items,
                     COALESCE(SUM(quantity_total), 0) as total_quantity,
                     COALESCE(SUM(quantity_total - quantity_available), 0) as checked_out_quantity,
                     (SELECT COUNT(*) FROM checkouts WHERE returned_at IS NULL) as active_checkouts,
@@ -491,7 +835,7 @@ class DatabaseManager:
                 FROM items
             """)
 
-            return InventoryStats(**dict(row))
+            return InventoryStats(**row)
         
     # ===== Audit Log =====
 
@@ -506,7 +850,7 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             row = await conn.execute("""
                 INSERT INTO audit_log (guild_id, user_id, action, item_id, details)
                 VALUES ($1, $2, $3, $4, $5)
@@ -517,7 +861,7 @@ class DatabaseManager:
         if not self.pool:
             raise DatabaseNotInitializedError()
         
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             rows = await conn.fetch("""
                 SELECT * FROM audit_log
                 WHERE guild_id = $1
@@ -529,5 +873,5 @@ class DatabaseManager:
     # ===== Spreadsheets =====
     def trigger_sheets_sync(self, guild_id: int):
         if self.sheets_manager and self.sheets_manager.client:
-            asyncio.create_task(self.sheets_manager.full_sync(self, guild_id))
+            self.sheets_manager.start_full_sync(self, guild_id, coalesce=True)
 
@@ -0,0 +1,5 @@
+-- /inventory always filters by guild, optionally by subteam and location
+CREATE INDEX IF NOT EXISTS idx_items_guild_filters ON items(guild_id, subteam, location);
+
+-- Serves search_items' ORDER BY item_name and the LIMIT/OFFSET pages without a sort
+CREATE INDEX IF NOT EXISTS idx_items_guild_name ON items(guild_id, item_name, id);
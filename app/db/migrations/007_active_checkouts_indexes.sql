@@ -0,0 +1,5 @@
+-- /allcheckouts and the sheets sync list a guild's active checkouts newest first
+CREATE INDEX IF NOT EXISTS idx_checkouts_guild_active ON checkouts(guild_id, checked_out_at DESC) WHERE returned_at IS NULL;
+
+-- /mycheckouts narrows the same list to one borrower
+CREATE INDEX IF NOT EXISTS idx_checkouts_guild_user_active ON checkouts(guild_id, user_id, checked_out_at DESC) WHERE returned_at IS NULL;
@@ -0,0 +1,5 @@
+-- /inventory's search is a substring ILIKE, which a btree can't serve but trigrams can.
+-- pg_trgm is a trusted extension, so the database owner can enable it without superuser
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_items_name_trgm ON items USING gin (item_name gin_trgm_ops);
@@ -40,26 +40,16 @@ class MigrationManager:
         
         try:
             sql_content: str = migration_path.read_text(encoding='utf-8')
-            statements: List[str] = []
-            
-            for statement in sql_content.split(';'):
-                lines: List[str] = []
-                for line in statement.split('\n'):
-                    if '--' in line:
-                        line = line[:line.index('--')]
-                    lines.append(line)
-                
-                clean_statement: str = '\n'.join(lines).strip()
-                if clean_statement:
-                    statements.append(clean_statement)
-            
-            for stmt in statements:
-                await conn.execute(stmt)
-            
-            await conn.execute(
-                'INSERT INTO schema_migrations (migration_name) VALUES ($1)',
-                migration_path.name
-            )
+
+            # Without arguments asyncpg sends the whole file as one simple query, so
+            # Postgres does the statement splitting and comment handling itself.
+            # The transaction keeps a failed file from being half applied
+            async with conn.transaction():
+                await conn.execute(sql_content)
+                await conn.execute(
+                    'INSERT INTO schema_migrations (migration_name) VALUES ($1)',
+                    migration_path.name
+                )
             logger.info(f"Applied successfully: {migration_path.name}")
             
         except Exception as e:
@@ -103,9 +93,12 @@ class MigrationManager:
         try:
             await self.init_migrations_table(conn)
             
-            applied: List[str] = await self.get_applied_migrations(conn)
-            pending: List[Path] = self.get_pending_migrations(applied)
-            all_files: List[Path] = self.get_all_migration_files()
+            # Scan the directory off the loop while the applied list is fetched
+            applied, all_files = await asyncio.gather(
+                self.get_applied_migrations(conn),
+                asyncio.to_thread(self.get_all_migration_files),
+            )
+            pending: List[Path] = [m for m in all_files if m.name not in applied]
             
             logger.info("Migration Status Report")
             logger.info(f"Total migrations: {len(all_files)}")
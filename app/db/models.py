@@ -20,7 +20,7 @@ class User(BaseModel):
 
     @classmethod
     def from_record(cls, record):
-        return cls(**dict(record))
+        return cls(**record)
     
 class GuildPermission(BaseModel):
     id: int
@@ -111,7 +111,7 @@ class Item(BaseModel):
     @classmethod
     def from_record(cls, record):
         """Create from asyncpg record"""
-        return cls(**dict(record))
+        return cls(**record)
 
 class CreateItemRequest(BaseModel):
     item_name: str = Field(min_length=1, max_length=200)
@@ -188,7 +188,14 @@ class Checkout(BaseModel):
     @classmethod
     def from_record(cls, record):
         """Create from asyncpg record"""
-        return cls(**dict(record))
+        return cls(**record)
+
+class CheckoutWithItem(Checkout):
+    item_name: str
+
+class CheckoutReceipt(CheckoutWithItem):
+    remaining_available: int = Field(ge=0, description="Item quantity left after this checkout")
+    item_quantity_total: int = Field(ge=0)
 
 class CheckoutRequest(BaseModel):
     item_id: int
@@ -200,7 +207,8 @@ class CheckoutRequest(BaseModel):
     @classmethod
     def validate_return_date(cls, v):
         """Ensure return date is in the future"""
-        if v and v < datetime.now():
+        # Compare in the value's own timezone so naive and aware inputs both work
+        if v and v < datetime.now(v.tzinfo):
             raise ValueError('Expected return date must be in the future')
         return v
 
@@ -216,7 +224,7 @@ class AuditLog(BaseModel):
     
     @classmethod
     def from_record(cls, record):
-        return cls(**dict(record))
+        return cls(**record)
 
 class InventoryStats(BaseModel):
     total_items: int
@@ -1,10 +1,18 @@
 # app/integrations/sheets_manager.py
+import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional
 from oauth2client.service_account import ServiceAccountCredentials
 import gspread
-
-from app.config import GOOGLE_SHEETS_FOLDER_ID, GOOGLE_SERVICE_ACCOUNT_FILE
+from gspread.utils import a1_range_to_grid_range
+from requests.adapters import HTTPAdapter
+
+from app.config import (
+    GOOGLE_HTTP_POOL_CONNECTIONS,
+    GOOGLE_HTTP_POOL_MAXSIZE,
+    GOOGLE_SHEETS_FOLDER_ID,
+    GOOGLE_SERVICE_ACCOUNT_FILE,
+)
 from app.db.models import Item, Checkout, AuditLog, User
 from app.sheets.auth import get_credentials
 from app.utils.logger import logger
@@ -15,6 +23,8 @@ class SheetsManager:
         self.service_account_file = GOOGLE_SERVICE_ACCOUNT_FILE
         self.client = None
         self._sheet_cache: Dict[int, gspread.Spreadsheet] = {}
+        self._sync_tasks: Dict[int, asyncio.Task] = {}
+        self._resync_pending: set[int] = set()
         self._sheet_to_header_len: Dict[str, int] = {
             "Items": 11,
             "Checkouts": 8,
@@ -28,7 +38,15 @@ class SheetsManager:
     def connect(self):
         try:
             creds = get_credentials()
+
             self.client = gspread.authorize(creds)  # type: ignore
+
+            # Widen the pool on gspread's own authorized session so concurrent calls reuse keep-alive connections
+            adapter = HTTPAdapter(
+                pool_connections=GOOGLE_HTTP_POOL_CONNECTIONS,
+                pool_maxsize=GOOGLE_HTTP_POOL_MAXSIZE,
+            )
+            self.client.http_client.session.mount("https://", adapter)
             logger.info("Connected to Google Sheets API")
             return True
         except Exception as e:
@@ -45,7 +63,8 @@ class SheetsManager:
     async def get_sheet_for_guild(
         self, guild_id: int, sheet_id: str
     ) -> Optional[gspread.Spreadsheet]:
-        self.connect()
+        if not self.client:
+            self.connect()
         if not self.client:
             return None
 
@@ -53,7 +72,7 @@ class SheetsManager:
             return self._sheet_cache[guild_id]
 
         try:
-            spreadsheet = self.client.open_by_key(sheet_id)
+            spreadsheet = await asyncio.to_thread(self.client.open_by_key, sheet_id)
             self._sheet_cache[guild_id] = spreadsheet
             return spreadsheet
         except Exception as e:
@@ -63,20 +82,23 @@ class SheetsManager:
     async def create_sheet_for_guild(
         self, guild_id: int, guild_name: str
     ) -> tuple[str, str]:
-        self.connect()
+        if not self.client:
+            self.connect()
         if not self.client:
             raise Exception("Google Sheets client not connected")
 
         try:
             sheet_title = f"{guild_name} - Inventory Database"
-            spreadsheet = self.client.create(sheet_title, GOOGLE_SHEETS_FOLDER_ID)
+            spreadsheet = await asyncio.to_thread(
+                self.client.create, sheet_title, GOOGLE_SHEETS_FOLDER_ID
+            )
 
             sheet_id = spreadsheet.id
             sheet_url = spreadsheet.url
 
             self._sheet_cache[guild_id] = spreadsheet
 
-            await self._initialize_sheet_structure(spreadsheet, guild_name)
+            await asyncio.to_thread(self._initialize_sheet_structure, spreadsheet, guild_name)
 
             logger.info(f"Created Google Sheet for guild '{guild_name}': {sheet_url}")
             return sheet_id, sheet_url
@@ -87,129 +109,80 @@ class SheetsManager:
 
     async def make_sheet_public(self, spreadsheet: gspread.Spreadsheet) -> bool:
         try:
-            spreadsheet.share(None, perm_type="anyone", role="reader")  # type: ignore
+            await asyncio.to_thread(
+                spreadsheet.share, None, perm_type="anyone", role="reader"  # type: ignore
+            )
             return True
         except Exception as e:
             logger.warning(f"Could not make sheet public: {e}")
             return False
 
-    def _apply_default_font(self, sheet: gspread.Worksheet, num_cols: int):
-        col_letter = _get_column_letter(num_cols)
-        sheet.format(f"A:{col_letter}", self._default_format)
-
     def _auto_resize_columns(self, spreadsheet: gspread.Spreadsheet, sheet: gspread.Worksheet, num_cols: int):
         try:
             sheet.columns_auto_resize(0, num_cols)
         except Exception as e:
             logger.warning(f"Could not auto-resize columns for '{sheet.title}': {e}")
 
-    async def _initialize_sheet_structure(
+    # gspread is blocking; the plain def helpers below are run via asyncio.to_thread
+    def _initialize_sheet_structure(
         self, spreadsheet: gspread.Spreadsheet, guild_name: str
     ):  
+        # One metadata read, one addSheet batch and one batch_update for every header,
+        # format, freeze and merge, instead of a Sheets API call per step per tab
         sheets_to_create = ["Items", "Active Checkouts", "Audit Log", "Stats"]
-        for sheet_name in sheets_to_create:
-            try:
-                spreadsheet.worksheet(sheet_name)
-            except gspread.WorksheetNotFound:
-                spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
-
-        await self._setup_items_sheet(spreadsheet)
-        await self._setup_checkouts_sheet(spreadsheet)
-        await self._setup_audit_sheet(spreadsheet)
-        await self._setup_stats_sheet(spreadsheet, guild_name)
+        sheet_ids = {ws.title: ws.id for ws in spreadsheet.worksheets()}
+
+        missing = [name for name in sheets_to_create if name not in sheet_ids]
+        if missing:
+            reply = spreadsheet.batch_update({"requests": [
+                {"addSheet": {"properties": {
+                    "title": name,
+                    "gridProperties": {"rowCount": 1000, "columnCount": 20},
+                }}}
+                for name in missing
+            ]})
+            for added in reply["replies"]:
+                properties = added["addSheet"]["properties"]
+                sheet_ids[properties["title"]] = properties["sheetId"]
+
+        requests = [
+            *self._setup_items_sheet(sheet_ids["Items"]),
+            *self._setup_checkouts_sheet(sheet_ids["Active Checkouts"]),
+            *self._setup_audit_sheet(sheet_ids["Audit Log"]),
+            *self._setup_stats_sheet(sheet_ids["Stats"], guild_name),
+        ]
 
-        if spreadsheet.sheet1.title == "Sheet1":
-            spreadsheet.del_worksheet(spreadsheet.sheet1)
+        if "Sheet1" in sheet_ids:
+            requests.append({"deleteSheet": {"sheetId": sheet_ids["Sheet1"]}})
 
-    async def _setup_items_sheet(self, spreadsheet: gspread.Spreadsheet):
-        sheet = spreadsheet.worksheet("Items")
+        spreadsheet.batch_update({"requests": requests})
 
+    def _setup_items_sheet(self, sheet_id: int) -> list:
         headers = [
             "Item ID", "Item Name", "Total Qty", "Available",
             "Checked Out", "Location", "Subteam", "Point of Contact",
             "Purchase Order", "Description", "Created At",
         ]
+        return _header_sheet_requests(
+            sheet_id, headers, {"red": 0.2, "green": 0.6, "blue": 0.9}, self._default_format
+        )
 
-        col_end = _get_column_letter(len(headers))
-
-        sheet.update(f"A1:{col_end}1", [headers])  # type: ignore
-        sheet.format(f"A1:{col_end}1", {
-            "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 0.9},
-            "textFormat": {
-                "bold": True,
-                "fontFamily": "Calibri",
-                "fontSize": 11,
-                "foregroundColor": {"red": 1, "green": 1, "blue": 1},
-            },
-            "horizontalAlignment": "CENTER",
-        })
-        sheet.freeze(rows=1)
-        self._apply_default_font(sheet, len(headers))
-        self._auto_resize_columns(spreadsheet, sheet, len(headers))
-
-    async def _setup_checkouts_sheet(self, spreadsheet: gspread.Spreadsheet):
-        sheet = spreadsheet.worksheet("Active Checkouts")
-
+    def _setup_checkouts_sheet(self, sheet_id: int) -> list:
         headers = [
             "Checkout ID", "Item Name", "User", "Quantity",
             "Checked Out", "Expected Return", "Days Out", "Notes",
         ]
+        return _header_sheet_requests(
+            sheet_id, headers, {"red": 0.9, "green": 0.6, "blue": 0.2}, self._default_format
+        )
 
-        col_end = _get_column_letter(len(headers))
-
-        sheet.update(f"A1:{col_end}1", [headers])  # type: ignore
-        sheet.format(f"A1:{col_end}1", {
-            "backgroundColor": {"red": 0.9, "green": 0.6, "blue": 0.2},
-            "textFormat": {
-                "bold": True,
-                "fontFamily": "Calibri",
-                "fontSize": 11,
-                "foregroundColor": {"red": 1, "green": 1, "blue": 1},
-            },
-            "horizontalAlignment": "CENTER",
-        })
-        sheet.freeze(rows=1)
-        self._apply_default_font(sheet, len(headers))
-        self._auto_resize_columns(spreadsheet, sheet, len(headers))
-
-    async def _setup_audit_sheet(self, spreadsheet: gspread.Spreadsheet):
-        sheet = spreadsheet.worksheet("Audit Log")
-
+    def _setup_audit_sheet(self, sheet_id: int) -> list:
         headers = ["Timestamp", "User", "Action", "Item ID", "Details"]
+        return _header_sheet_requests(
+            sheet_id, headers, {"red": 0.5, "green": 0.5, "blue": 0.5}, self._default_format
+        )
 
-        col_end = _get_column_letter(len(headers))
-
-        sheet.update(f"A1:{col_end}1", [headers])  # type: ignore
-        sheet.format(f"A1:{col_end}1", {
-            "backgroundColor": {"red": 0.5, "green": 0.5, "blue": 0.5},
-            "textFormat": {
-                "bold": True,
-                "fontFamily": "Calibri",
-                "fontSize": 11,
-                "foregroundColor": {"red": 1, "green": 1, "blue": 1},
-            },
-            "horizontalAlignment": "CENTER",
-        })
-        sheet.freeze(rows=1)
-        self._apply_default_font(sheet, len(headers))
-        self._auto_resize_columns(spreadsheet, sheet, len(headers))
-
-    async def _setup_stats_sheet(self, spreadsheet: gspread.Spreadsheet, guild_name: str):
-        sheet = spreadsheet.worksheet("Stats")
-
-        sheet.update("A1:B1", [[f"{guild_name} - Inventory Statistics", ""]])  # type: ignore
-        sheet.format("A1:B1", {
-            "backgroundColor": {"red": 0.3, "green": 0.7, "blue": 0.3},
-            "textFormat": {
-                "bold": True,
-                "fontFamily": "Calibri",
-                "fontSize": 14,
-                "foregroundColor": {"red": 1, "green": 1, "blue": 1},
-            },
-            "horizontalAlignment": "CENTER",
-        })
-        sheet.merge_cells("A1:B1")
-
+    def _setup_stats_sheet(self, sheet_id: int, guild_name: str) -> list:
         stats_labels = [
             "Total Items",
             "Total Quantity",
@@ -220,13 +193,72 @@ class SheetsManager:
             "Last Updated",
         ]
 
-        label_rows = [[label] for label in stats_labels]
-        sheet.update(f"A2:A{1 + len(stats_labels)}", label_rows)  # type: ignore
+        return [
+            _format_request(sheet_id, "A:B", self._default_format),
+            _values_request(sheet_id, "A1:B1", [[f"{guild_name} - Inventory Statistics", ""]]),
+            _format_request(sheet_id, "A1:B1", {
+                "backgroundColor": {"red": 0.3, "green": 0.7, "blue": 0.3},
+                "textFormat": {
+                    "bold": True,
+                    "fontFamily": "Calibri",
+                    "fontSize": 14,
+                    "foregroundColor": {"red": 1, "green": 1, "blue": 1},
+                },
+                "horizontalAlignment": "CENTER",
+            }),
+            {"mergeCells": {
+                "range": a1_range_to_grid_range("A1:B1", sheet_id),
+                "mergeType": "MERGE_ALL",
+            }},
+            _values_request(
+                sheet_id, f"A2:A{1 + len(stats_labels)}", [[label] for label in stats_labels]
+            ),
+            _format_request(sheet_id, f"A2:A{1 + len(stats_labels)}", {
+                "textFormat": {"bold": True, "fontFamily": "Calibri", "fontSize": 11}
+            }),
+            _auto_resize_request(sheet_id, 2),
+        ]
+
+    def _replace_rows(
+        self, spreadsheet: gspread.Spreadsheet, sheet_name: str, num_cols: int, rows: list
+    ) -> gspread.Worksheet:
+        sheet = spreadsheet.worksheet(sheet_name)
+        last_col = _get_column_letter(num_cols)
+
+        if sheet.row_count > 1:
+            sheet.batch_clear([f"A2:{last_col}{sheet.row_count}"])
+
+        if rows:
+            sheet.update(
+                f"A2:{last_col}{len(rows) + 1}",
+                rows,  # type: ignore
+            )
+
+        self._auto_resize_columns(spreadsheet, sheet, num_cols)
+        return sheet
+
+    def _highlight_rows(self, sheet: gspread.Worksheet, row_nums: List[int]):
+        # batch_clear only clears values, so reset the old highlights in the same
+        # single request that marks the current rows
+        formats = [{
+            "range": f"A2:H{max(sheet.row_count, 2)}",
+            "format": {"backgroundColor": {"red": 1, "green": 1, "blue": 1}},
+        }]
+        formats += [
+            {
+                "range": f"A{row_num}:H{row_num}",
+                "format": {"backgroundColor": {"red": 1, "green": 0.8, "blue": 0.8}},
+            }
+            for row_num in row_nums
+        ]
+        sheet.batch_format(formats)
+
+    def _append_row(self, spreadsheet: gspread.Spreadsheet, sheet_name: str, row: list):
+        spreadsheet.worksheet(sheet_name).append_row(row)
 
-        sheet.format("A:A", {
-            "textFormat": {"bold": True, "fontFamily": "Calibri", "fontSize": 11}
-        })
-        self._apply_default_font(sheet, 2)
+    def _write_stats(self, spreadsheet: gspread.Spreadsheet, values: list):
+        sheet = spreadsheet.worksheet("Stats")
+        sheet.update("B2:B8", values)  # type: ignore
         self._auto_resize_columns(spreadsheet, sheet, 2)
 
     async def sync_items(self, guild_id: int, sheet_id: str, items: List[Item], usernames: dict[int, str]) -> bool:
@@ -236,35 +268,26 @@ class SheetsManager:
             return False
 
         try:
-            sheet = spreadsheet.worksheet("Items")
             num_cols = self._sheet_to_header_len["Items"]
 
-            rows = []
-            for item in items:
-                rows.append([
+            rows = [
+                [
                     item.id,
                     item.item_name,
                     item.quantity_total,
                     item.quantity_available,
                     item.quantity_checked_out,
                     item.location,
-                    item.subteam.value if hasattr(item.subteam, "value") else item.subteam,
+                    item.subteam.value,
                     usernames.get(item.point_of_contact, f"Unknown ({item.point_of_contact})"),
                     item.purchase_order,
                     item.description or "",
                     item.created_at.strftime("%Y-%m-%d %H:%M") if item.created_at else "",
-                ])
-
-            if sheet.row_count > 1:
-                sheet.batch_clear([f"A2:{_get_column_letter(num_cols)}{sheet.row_count}"])
-
-            if rows:
-                sheet.update(
-                    f"A2:{_get_column_letter(num_cols)}{len(rows) + 1}",
-                    rows,  # type: ignore
-                )
+                ]
+                for item in items
+            ]
 
-            self._auto_resize_columns(spreadsheet, sheet, num_cols)
+            await asyncio.to_thread(self._replace_rows, spreadsheet, "Items", num_cols, rows)
             logger.info(f"Synced {len(items)} items for guild {guild_id}")
             return True
 
@@ -281,7 +304,6 @@ class SheetsManager:
             return False
 
         try:
-            sheet = spreadsheet.worksheet("Active Checkouts")
             num_cols = self._sheet_to_header_len["Checkouts"]
 
             rows = []
@@ -306,23 +328,10 @@ class SheetsManager:
                 if checkout.is_overdue:
                     overdue_rows.append(i + 2)
 
-            last_col = _get_column_letter(num_cols)
-
-            if sheet.row_count > 1:
-                sheet.batch_clear([f"A2:{last_col}{sheet.row_count}"])
-
-            if rows:
-                sheet.update(
-                    f"A2:{last_col}{len(rows) + 1}",
-                    rows,  # type: ignore
-                )
-
-                for row_num in overdue_rows:
-                    sheet.format(f"A{row_num}:H{row_num}", {
-                        "backgroundColor": {"red": 1, "green": 0.8, "blue": 0.8}
-                    })
-
-            self._auto_resize_columns(spreadsheet, sheet, num_cols)
+            sheet = await asyncio.to_thread(
+                self._replace_rows, spreadsheet, "Active Checkouts", num_cols, rows
+            )
+            await asyncio.to_thread(self._highlight_rows, sheet, overdue_rows)
             logger.info(f"Synced {len(checkouts)} checkouts for guild {guild_id}")
             return True
 
@@ -337,31 +346,20 @@ class SheetsManager:
             return False
 
         try:
-            sheet = spreadsheet.worksheet("Audit Log")
             num_cols = self._sheet_to_header_len["Audit"]
 
-            rows = []
-            for log in logs:
-                rows.append([
+            rows = [
+                [
                     log.created_at.strftime("%Y-%m-%d %H:%M:%S"),
                     usernames.get(log.user_id, f"Unknown ({log.user_id})"),
                     log.action,
                     str(log.item_id) if log.item_id else "N/A",
                     log.details,
-                ])
-
-            last_col = _get_column_letter(num_cols)
-
-            if sheet.row_count > 1:
-                sheet.batch_clear([f"A2:{last_col}{sheet.row_count}"])
-
-            if rows:
-                sheet.update(
-                    f"A2:{last_col}{len(rows) + 1}",
-                    rows,  # type: ignore
-                )
+                ]
+                for log in logs
+            ]
 
-            self._auto_resize_columns(spreadsheet, sheet, num_cols)
+            await asyncio.to_thread(self._replace_rows, spreadsheet, "Audit Log", num_cols, rows)
             logger.info(f"Synced {len(rows)} audit log entries for guild {guild_id}")
             return True
 
@@ -375,8 +373,6 @@ class SheetsManager:
             return
 
         try:
-            sheet = spreadsheet.worksheet("Audit Log")
-
             row = [
                 log_entry.created_at.strftime("%Y-%m-%d %H:%M:%S"),
                 f"User ID: {log_entry.user_id}",
@@ -385,7 +381,7 @@ class SheetsManager:
                 log_entry.details,
             ]
 
-            sheet.append_row(row)
+            await asyncio.to_thread(self._append_row, spreadsheet, "Audit Log", row)
 
         except Exception as e:
             logger.error(f"Failed to append audit log for guild {guild_id}: {e}")
@@ -396,9 +392,7 @@ class SheetsManager:
             return False
 
         try:
-            sheet = spreadsheet.worksheet("Stats")
-
-            sheet.update("B2:B8", [
+            values = [
                 [stats.get("total_items", 0)],
                 [stats.get("total_quantity", 0)],
                 [stats.get("checked_out_quantity", 0)],
@@ -406,15 +400,41 @@ class SheetsManager:
                 [f"{stats.get('utilization_rate', 0):.1f}%"],
                 [""],
                 [datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-            ])  # type: ignore
+            ]
 
-            self._auto_resize_columns(spreadsheet, sheet, 2)
+            await asyncio.to_thread(self._write_stats, spreadsheet, values)
             return True
 
         except Exception as e:
             logger.error(f"Failed to update stats for guild {guild_id}: {e}")
             return False
 
+    def is_syncing(self, guild_id: int) -> bool:
+        task = self._sync_tasks.get(guild_id)
+        return task is not None and not task.done()
+
+    def start_full_sync(self, db_manager, guild_id: int, coalesce: bool = False) -> bool:
+        if self.is_syncing(guild_id):
+            # A sync already in flight may have read stale data; queue a single re-run
+            if coalesce:
+                self._resync_pending.add(guild_id)
+            return False
+
+        task = asyncio.create_task(self.full_sync(db_manager, guild_id))
+        self._sync_tasks[guild_id] = task
+        task.add_done_callback(lambda t: self._on_sync_done(t, db_manager, guild_id))
+        return True
+
+    def _on_sync_done(self, task: asyncio.Task, db_manager, guild_id: int):
+        self._sync_tasks.pop(guild_id, None)
+
+        if not task.cancelled() and task.exception():
+            logger.error(f"Google Sheets sync failed for guild {guild_id}: {task.exception()}")
+
+        if guild_id in self._resync_pending:
+            self._resync_pending.discard(guild_id)
+            self.start_full_sync(db_manager, guild_id)
+
     async def full_sync(self, db_manager, guild_id: int) -> bool:
         settings = await db_manager.get_guild_settings(guild_id)
         if not settings or not settings.google_sheet_id:
@@ -423,9 +443,12 @@ class SheetsManager:
 
         logger.info(f"Starting full Google Sheets sync for guild {guild_id}...")
 
-        items = await db_manager.search_items(guild_id)
-        checkouts = await db_manager.get_active_checkouts(guild_id)
-        audit_logs = await db_manager.get_audit_log(guild_id, limit=100)
+        # Independent reads, each on its own pooled connection
+        items, checkouts, audit_logs = await asyncio.gather(
+            db_manager.search_items(guild_id),
+            db_manager.get_active_checkouts(guild_id),
+            db_manager.get_audit_log(guild_id, limit=100),
+        )
 
         all_user_ids = (
             [item.point_of_contact for item in items]
@@ -437,10 +460,6 @@ class SheetsManager:
 
         items_map = {item.id: item.item_name for item in items}
 
-        success = await self.sync_items(guild_id, settings.google_sheet_id, items, usernames)
-        success |= await self.sync_checkouts(guild_id, settings.google_sheet_id, checkouts, items_map, usernames)
-        success |= await self.sync_audit_log(guild_id, settings.google_sheet_id, audit_logs, usernames)
-
         total_qty = sum(item.quantity_total for item in items)
         checked_out_qty = sum(item.quantity_checked_out for item in items)
 
@@ -451,7 +470,21 @@ class SheetsManager:
             "active_checkouts": len(checkouts),
             "utilization_rate": (checked_out_qty / total_qty * 100) if total_qty else 0,
         }
-        success |= await self.update_stats(guild_id, settings.google_sheet_id, stats)
+
+        # Load the spreadsheet once up front so the concurrent writers below share
+        # the cached handle instead of each opening it
+        if not await self.get_sheet_for_guild(guild_id, settings.google_sheet_id):
+            logger.warning(f"Could not get spreadsheet for guild {guild_id}")
+            return False
+
+        # Each writer touches its own worksheet and runs its gspread calls in a thread
+        results = await asyncio.gather(
+            self.sync_items(guild_id, settings.google_sheet_id, items, usernames),
+            self.sync_checkouts(guild_id, settings.google_sheet_id, checkouts, items_map, usernames),
+            self.sync_audit_log(guild_id, settings.google_sheet_id, audit_logs, usernames),
+            self.update_stats(guild_id, settings.google_sheet_id, stats),
+        )
+        success = any(results)
 
         if not success:
             logger.info("Google Sheets full sync complete")
@@ -467,3 +500,56 @@ def _get_column_letter(n: int):
         result = chr(65 + (n % 26)) + result
         n //= 26
     return result
+
+
+def _format_request(sheet_id: int, a1_range: str, cell_format: dict) -> dict:
+    # Same field mask Worksheet.format uses
+    return {"repeatCell": {
+        "range": a1_range_to_grid_range(a1_range, sheet_id),
+        "cell": {"userEnteredFormat": cell_format},
+        "fields": f"userEnteredFormat({','.join(cell_format)})",
+    }}
+
+
+def _values_request(sheet_id: int, a1_range: str, rows: list[list[str]]) -> dict:
+    return {"updateCells": {
+        "range": a1_range_to_grid_range(a1_range, sheet_id),
+        "rows": [
+            {"values": [{"userEnteredValue": {"stringValue": value}} for value in row]}
+            for row in rows
+        ],
+        "fields": "userEnteredValue",
+    }}
+
+
+def _auto_resize_request(sheet_id: int, num_cols: int) -> dict:
+    return {"autoResizeDimensions": {"dimensions": {
+        "sheetId": sheet_id, "dimension": "COLUMNS", "startIndex": 0, "endIndex": num_cols,
+    }}}
+
+
+def _header_sheet_requests(
+    sheet_id: int, headers: list[str], header_color: dict, default_format: dict
+) -> list:
+    col_end = _get_column_letter(len(headers))
+    # The default font goes first: a format replaces the whole textFormat of its
+    # range, so applying it last would wipe the bold header style
+    return [
+        _format_request(sheet_id, f"A:{col_end}", default_format),
+        _values_request(sheet_id, f"A1:{col_end}1", [headers]),
+        _format_request(sheet_id, f"A1:{col_end}1", {
+            "backgroundColor": header_color,
+            "textFormat": {
+                "bold": True,
+                "fontFamily": "Calibri",
+                "fontSize": 11,
+                "foregroundColor": {"red": 1, "green": 1, "blue": 1},
+            },
+            "horizontalAlignment": "CENTER",
+        }),
+        {"updateSheetProperties": {
+            "properties": {"sheetId": sheet_id, "gridProperties": {"frozenRowCount": 1}},
+            "fields": "gridProperties.frozenRowCount",
+        }},
+        _auto_resize_request(sheet_id, len(headers)),
+    ]
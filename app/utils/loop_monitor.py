@@ -0,0 +1,16 @@
+import asyncio
+
+from app.config import LOOP_LAG_CHECK_INTERVAL_S, LOOP_LAG_WARN_S
+from app.utils.logger import logger
+
+
+async def monitor_loop_lag():
+    # A sleep that wakes up late means something held the loop without yielding
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(LOOP_LAG_CHECK_INTERVAL_S)
+        lag = loop.time() - started - LOOP_LAG_CHECK_INTERVAL_S
+
+        if lag > LOOP_LAG_WARN_S:
+            logger.warning(f"Event loop was blocked for ~{lag * 1000:.0f} ms")
@@ -50,6 +50,26 @@ async def test_ensure_guild_member_idempotent(db):
     assert perms is not None
 
 
+@pytest.mark.asyncio
+async def test_ensure_guild_members_batch(db):
+    await db.ensure_guild_members(1234, [(100, "alice"), (101, "bob")])
+
+    users = await db.get_users_batch([100, 101])
+    assert users[100].username == "alice"
+    assert users[101].username == "bob"
+
+    assert await db.get_user_permissions(1234, 100) is not None
+    assert await db.get_user_permissions(1234, 101) is not None
+
+
+@pytest.mark.asyncio
+async def test_ensure_guild_members_same_user_twice(db):
+    await db.ensure_guild_members(1234, [(100, "alice"), (100, "alice")])
+
+    perms = await db.get_user_permissions(1234, 100)
+    assert perms is not None
+
+
 # ===== ADMIN PERMISSIONS =====
 
 @pytest.mark.asyncio
@@ -94,7 +114,69 @@ async def test_admin_isolated_per_guild(db):
 
 
 @pytest.mark.asyncio
-async def test_get_guild_admins(db):
+async def test_set_admin_invalidates_cached_status(db):
+    await db.ensure_guild_member(1234, 100, "alice")
+
+    assert await db.is_admin(1234, 100) is False
+
+    await db.set_admin(1234, 100, True)
+
+    assert await db.is_admin(1234, 100) is True
+
+
+@pytest.mark.asyncio
+async def test_is_admin_does_not_cache_read_raced_by_revoke(db, monkeypatch):
+    await db.ensure_guild_member(1234, 100, "alice")
+    await db.set_admin(1234, 100, True)
+
+    get_user_permissions = db.get_user_permissions
+
+    async def read_then_revoke(guild_id, user_id):
+        perms = await get_user_permissions(guild_id, user_id)
+        await db.set_admin(guild_id, user_id, False)
+        return perms
+
+    monkeypatch.setattr(db, "get_user_permissions", read_then_revoke)
+    assert await db.is_admin(1234, 100) is True
+    monkeypatch.undo()
+
+    assert await db.is_admin(1234, 100) is False
+
+
+@pytest.mark.asyncio
+async def test_admin_cache_prunes_expired_entries(db, monkeypatch):
+    monkeypatch.setattr("app.db.db_manager.ADMIN_CACHE_MAX_ENTRIES", 3)
+    monkeypatch.setattr("app.db.db_manager.ADMIN_CACHE_TTL_S", -1)
+
+    for user_id in range(100, 110):
+        await db.is_admin(1234, user_id)
+
+    assert len(db._admin_cache) <= 3
+
+@pytest.mark.asyncio
+async def test_apply_admin_change(db):
+    await db.apply_admin_change(1234, 100, "alice", 101, "bob", True)
+
+    users = await db.get_users_batch([100, 101])
+    assert set(users.keys()) == {100, 101}
+
+    assert await db.is_admin(1234, 100) is False
+    assert await db.is_admin(1234, 101) is True
+
+    await db.apply_admin_change(1234, 100, "alice", 101, "bob", False)
+
+    assert await db.is_admin(1234, 101) is False
+
+
+@pytest.mark.asyncio
+async def test_apply_admin_change_self(db):
+    await db.apply_admin_change(1234, 100, "alice", 100, "alice", True)
+
+    assert await db.is_admin(1234, 100) is True
+
+
+@pytest.mark.asyncio
+async def test_get_guild_admin_user_ids(db):
     await db.ensure_guild_member(1234, 100, "alice")
     await db.ensure_guild_member(1234, 101, "bob")
     await db.ensure_guild_member(1234, 102, "charlie")
@@ -103,19 +185,29 @@ async def test_get_guild_admins(db):
     await db.set_admin(1234, 101, True)
     # charlie is not admin
 
-    admins = await db.get_guild_admins(1234)
-    admin_ids = [a.user_id for a in admins]
+    admin_ids, total = await db.get_guild_admin_user_ids(1234, 25)
+
+    assert total == 2
+    assert admin_ids == [100, 101]
+
+
+@pytest.mark.asyncio
+async def test_get_guild_admin_user_ids_limit(db):
+    for user_id, name in ((100, "alice"), (101, "bob"), (102, "charlie")):
+        await db.ensure_guild_member(1234, user_id, name)
+        await db.set_admin(1234, user_id, True)
+
+    admin_ids, total = await db.get_guild_admin_user_ids(1234, 2)
 
-    assert len(admins) == 2
-    assert 100 in admin_ids
-    assert 101 in admin_ids
-    assert 102 not in admin_ids
+    assert admin_ids == [100, 101]
+    assert total == 3
 
 
 @pytest.mark.asyncio
-async def test_get_guild_admins_empty(db):
-    admins = await db.get_guild_admins(1234)
-    assert len(admins) == 0
+async def test_get_guild_admin_user_ids_empty(db):
+    admin_ids, total = await db.get_guild_admin_user_ids(1234, 25)
+    assert admin_ids == []
+    assert total == 0
 
 
 # ===== GUILD SETTINGS =====
@@ -171,6 +263,17 @@ async def test_get_guild_settings_nonexistent(db):
     assert settings is None
 
 
+@pytest.mark.asyncio
+async def test_get_guild_settings_reflects_sheet_update(db):
+    await db.upsert_guild_settings(1234, "Test Server")
+    assert (await db.get_guild_settings(1234)).google_sheet_id is None
+
+    await db.set_guild_sheet(1234, "sheet_id_123", "https://sheets.example.com")
+
+    settings = await db.get_guild_settings(1234)
+    assert settings.google_sheet_id == "sheet_id_123"
+
+
 @pytest.mark.asyncio
 async def test_set_guild_sheet(db):
     await db.upsert_guild_settings(1234, "Test Server")
@@ -1,5 +1,5 @@
 import pytest
-from app.db.models import CheckoutRequest, CreateItemRequest, Subteam
+from app.db.models import CheckoutRequest, CreateItemRequest, Subteam, UpdateItemRequest
 
 
 # ===== Helper =====
@@ -38,6 +38,37 @@ async def test_checkout_basic(db):
     assert checkout.user_id == 12
 
 
+@pytest.mark.asyncio
+async def test_checkout_returns_remaining_availability(db):
+    item = await _create_test_item(db, name="Drill", quantity=10)
+
+    checkout = await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=3), # type: ignore
+        guild_id=1234,
+        user_id=12,
+    )
+
+    assert checkout.item_name == "Drill"
+    assert checkout.remaining_available == 7
+    assert checkout.item_quantity_total == 10
+
+
+@pytest.mark.asyncio
+async def test_checkout_upserts_new_borrower(db):
+    item = await _create_test_item(db, quantity=5)
+
+    checkout = await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=1), # type: ignore
+        guild_id=1234,
+        user_id=77,
+        username="newcomer",
+    )
+
+    assert checkout is not None
+    user = await db.get_user(77)
+    assert user.username == "newcomer"
+
+
 @pytest.mark.asyncio
 async def test_checkout_reduces_availability(db):
     item = await _create_test_item(db, quantity=10)
@@ -183,6 +214,22 @@ async def test_return_item(db):
     assert updated.quantity_checked_out == 0
 
 
+@pytest.mark.asyncio
+async def test_cached_item_reflects_checkout_and_return(db):
+    item = await _create_test_item(db, quantity=10)
+    assert (await db.get_item(1234, item.id)).quantity_available == 10
+
+    checkout = await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=4), # type: ignore
+        guild_id=1234,
+        user_id=12,
+    )
+    assert (await db.get_item(1234, item.id)).quantity_available == 6
+
+    await db.return_item(checkout.id, guild_id=1234, returned_by=12)
+    assert (await db.get_item(1234, item.id)).quantity_available == 10
+
+
 @pytest.mark.asyncio
 async def test_return_partial_checkouts(db):
     item = await _create_test_item(db, quantity=10)
@@ -264,6 +311,28 @@ async def test_return_creates_audit_log(db):
     assert len(return_logs) >= 1
 
 
+@pytest.mark.asyncio
+async def test_double_return_logs_once(db):
+    item = await _create_test_item(db, quantity=5)
+
+    checkout = await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=2), # type: ignore
+        guild_id=1234,
+        user_id=12,
+    )
+
+    assert await db.return_item(checkout.id, guild_id=1234, returned_by=12)
+    assert not await db.return_item(checkout.id, guild_id=1234, returned_by=12)
+
+    refreshed = await db.get_item(1234, item.id)
+    assert refreshed.quantity_available == 5
+
+    logs = await db.get_audit_log(guild_id=1234, limit=10)
+    return_logs = [l for l in logs if l.action == "return"]
+    assert len(return_logs) == 1
+    assert return_logs[0].details == f"Returned 2x {item.item_name}"
+
+
 # ===== ACTIVE CHECKOUTS =====
 
 @pytest.mark.asyncio
@@ -334,6 +403,31 @@ async def test_get_active_checkouts_empty(db):
     assert len(checkouts) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_active_checkouts_with_items(db):
+    item = await _create_test_item(db, name="Oscilloscope", quantity=10)
+    await db.ensure_user_exists(13, "user2")
+
+    await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=2), # type: ignore
+        guild_id=1234,
+        user_id=12,
+    )
+    await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=3), # type: ignore
+        guild_id=1234,
+        user_id=13,
+    )
+
+    checkouts = await db.get_active_checkouts_with_items(1234)
+    assert len(checkouts) == 2
+    assert all(co.item_name == "Oscilloscope" for co in checkouts)
+
+    user13_checkouts = await db.get_active_checkouts_with_items(1234, user_id=13)
+    assert len(user13_checkouts) == 1
+    assert user13_checkouts[0].quantity == 3
+
+
 # ===== ITEM CHECKOUTS =====
 
 @pytest.mark.asyncio
@@ -358,4 +452,47 @@ async def test_get_item_checkouts_all(db):
     assert len(all_checkouts) == 2
 
     active_only = await db.get_item_checkouts(1234, item.id, active_only=True)
-    assert len(active_only) == 1
\ No newline at end of file
+    assert len(active_only) == 1
+
+# ===== QUANTITY EDITS =====
+
+@pytest.mark.asyncio
+async def test_resize_keeps_checked_out_stock(db):
+    item = await _create_test_item(db, quantity=10)
+
+    await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=4), # type: ignore
+        guild_id=1234,
+        user_id=12,
+    )
+
+    updated = await db.update_item(
+        1234, item.id,
+        UpdateItemRequest(quantity_total=6), # type: ignore
+        updated_by=12,
+    )
+    assert updated.quantity_total == 6
+    assert updated.quantity_available == 2
+    assert updated.location == "Lab"
+
+
+@pytest.mark.asyncio
+async def test_resize_below_checked_out_rejected(db):
+    item = await _create_test_item(db, quantity=10)
+
+    await db.checkout_item(
+        CheckoutRequest(item_id=item.id, quantity=4), # type: ignore
+        guild_id=1234,
+        user_id=12,
+    )
+
+    with pytest.raises(ValueError, match="4 items currently checked out"):
+        await db.update_item(
+            1234, item.id,
+            UpdateItemRequest(quantity_total=3, location="Shelf"), # type: ignore
+            updated_by=12,
+        )
+
+    unchanged = await db.get_item(1234, item.id)
+    assert unchanged.quantity_total == 10
+    assert unchanged.location == "Lab"
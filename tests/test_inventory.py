@@ -30,6 +30,28 @@ async def test_add_item(db):
     assert item.purchase_order == "PO 67"
 
 
+@pytest.mark.asyncio
+async def test_add_item_upserts_users(db):
+    item = await db.add_item(
+        CreateItemRequest(
+            item_name="Router",
+            quantity=2,
+            location="Cabinet",
+            subteam=Subteam("mechanical"),
+            point_of_contact=13,
+            purchase_order="PO 68",
+        ), # type: ignore
+        guild_id=1234,
+        added_by=12,
+        users=[(12, "creator"), (13, "poc"), (12, "creator")],
+    )
+
+    assert item.point_of_contact == 13
+    users = await db.get_users_batch([12, 13])
+    assert users[12].username == "creator"
+    assert users[13].username == "poc"
+
+
 @pytest.mark.asyncio
 async def test_add_item_creates_audit_log(db):
     await db.ensure_user_exists(12, "testuser")
@@ -55,6 +77,43 @@ async def test_add_item_creates_audit_log(db):
     assert "Servo Motor" in latest.details
 
 
+@pytest.mark.asyncio
+async def test_add_items_batch(db):
+    items = await db.add_items(
+        [
+            CreateItemRequest(
+                item_name=name,
+                quantity=qty,
+                location="Bin",
+                subteam=Subteam(subteam),
+                point_of_contact=13,
+                purchase_order="PO 101",
+            ) # type: ignore
+            for name, qty, subteam in [
+                ("Bolt", 50, "mechanical"),
+                ("Fuse", 10, "electrical"),
+                ("Nut", 75, "mechanical"),
+            ]
+        ],
+        guild_id=1234,
+        added_by=12,
+        users=[(12, "creator"), (13, "poc")],
+    )
+
+    assert [i.item_name for i in items] == ["Bolt", "Fuse", "Nut"]
+    assert [i.quantity_available for i in items] == [50, 10, 75]
+    assert items[1].subteam == Subteam.ELECTRICAL
+    assert items[0].description is None
+
+    logs = await db.get_audit_log(guild_id=1234, limit=10)
+    assert sorted(l.item_id for l in logs if l.action == "add_item") == [i.id for i in items]
+
+
+@pytest.mark.asyncio
+async def test_add_items_empty(db):
+    assert await db.add_items([], guild_id=1234, added_by=12) == []
+
+
 @pytest.mark.asyncio
 async def test_add_multiple_items_same_guild(db):
     await db.ensure_user_exists(12, "testuser")
@@ -172,6 +231,32 @@ async def test_get_item_wrong_guild_returns_none(db):
     assert fetched is None
 
 
+@pytest.mark.asyncio
+async def test_get_item_cache_invalidated_by_update(db):
+    await db.ensure_user_exists(12, "testuser")
+
+    created = await db.add_item(
+        CreateItemRequest(
+            item_name="Caliper",
+            quantity=2,
+            location="Bin 4",
+            subteam=Subteam("mechanical"),
+            point_of_contact=12,
+            purchase_order="PO 56",
+        ), # type: ignore
+        guild_id=1234,
+        added_by=12,
+    )
+    assert (await db.get_item(1234, created.id)).location == "Bin 4"
+
+    await db.update_item(
+        1234, created.id,
+        UpdateItemRequest(location="Bin 5"), # type: ignore
+        updated_by=12,
+    )
+    assert (await db.get_item(1234, created.id)).location == "Bin 5"
+
+
 @pytest.mark.asyncio
 async def test_get_nonexistent_item(db):
     result = await db.get_item(1234, 99999)
@@ -309,6 +394,39 @@ async def test_search_items_no_results(db):
     assert len(results) == 0
 
 
+
+@pytest.mark.asyncio
+async def test_search_items_page(db):
+    await db.ensure_user_exists(12, "testuser")
+
+    for name in ("Bolt", "Cable", "Drill", "Epoxy", "Fan"):
+        await db.add_item(
+            CreateItemRequest(
+                item_name=name,
+                quantity=1,
+                location="Lab",
+                subteam=Subteam("mechanical"),
+                point_of_contact=12,
+                purchase_order="PO 1",
+            ), # type: ignore
+            guild_id=1234,
+            added_by=12,
+        )
+
+    first, total = await db.search_items_page(1234, limit=2)
+    assert [item.item_name for item in first] == ["Bolt", "Cable"]
+    assert total == 5
+
+    last, total = await db.search_items_page(1234, limit=2, offset=4)
+    assert [item.item_name for item in last] == ["Fan"]
+    assert total == 5
+
+    filtered, total = await db.search_items_page(1234, search="dr", limit=2)
+    assert [item.item_name for item in filtered] == ["Drill"]
+    assert total == 1
+
+    assert await db.search_items_page(1234, search="nonexistent", limit=2) == ([], 0)
+
 # ===== UPDATE ITEM =====
 
 @pytest.mark.asyncio
@@ -339,6 +457,34 @@ async def test_update_item_name(db):
     assert updated.quantity_total == 5  # unchanged
 
 
+@pytest.mark.asyncio
+async def test_update_item_upserts_new_poc(db):
+    await db.ensure_user_exists(12, "testuser")
+
+    item = await db.add_item(
+        CreateItemRequest(
+            item_name="Scope",
+            quantity=1,
+            location="Lab",
+            subteam=Subteam("mechanical"),
+            point_of_contact=12,
+            purchase_order="PO 51",
+        ), # type: ignore
+        guild_id=1234,
+        added_by=12,
+    )
+
+    updated = await db.update_item(
+        1234, item.id,
+        UpdateItemRequest(point_of_contact=14), # type: ignore
+        updated_by=12,
+        users=[(14, "newpoc")],
+    )
+
+    assert updated.point_of_contact == 14
+    assert (await db.get_user(14)).username == "newpoc"
+
+
 @pytest.mark.asyncio
 async def test_update_item_quantity(db):
     await db.ensure_user_exists(12, "testuser")
@@ -424,6 +570,7 @@ async def test_update_item_creates_audit_log(db):
     logs = await db.get_audit_log(guild_id=1234, limit=10)
     edit_logs = [l for l in logs if l.action == "edit_item"]
     assert len(edit_logs) >= 1
+    assert edit_logs[0].details == "Updated: location=Lab"
 
 
 @pytest.mark.asyncio
@@ -437,6 +584,9 @@ async def test_update_nonexistent_item(db):
     )
     assert result is None
 
+    logs = await db.get_audit_log(guild_id=1234, limit=10)
+    assert not [l for l in logs if l.action == "edit_item"]
+
 
 @pytest.mark.asyncio
 async def test_update_item_no_changes(db):
@@ -513,6 +663,28 @@ async def test_delete_item_creates_audit_log(db):
     logs = await db.get_audit_log(guild_id=1234, limit=10)
     delete_logs = [l for l in logs if l.action == "delete_item"]
     assert len(delete_logs) >= 1
+    assert delete_logs[0].details == "Deleted Audit Delete"
+
+
+@pytest.mark.asyncio
+async def test_delete_item_other_guild(db):
+    await db.ensure_user_exists(12, "testuser")
+
+    item = await db.add_item(
+        CreateItemRequest(
+            item_name="Guarded",
+            quantity=1,
+            location="Lab",
+            subteam=Subteam("mechanical"),
+            point_of_contact=12,
+            purchase_order="PO 62",
+        ), # type: ignore
+        guild_id=1234,
+        added_by=12,
+    )
+
+    assert await db.delete_item(5678, item.id, deleted_by=12) is False
+    assert await db.get_item(1234, item.id) is not None
 
 
 @pytest.mark.asyncio
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pydantic import ValidationError
 
 from app.db.models import (
@@ -128,6 +128,16 @@ class TestCheckoutRequest:
         with pytest.raises(ValidationError):
             CheckoutRequest(item_id=1, quantity=1, expected_return_date=past) # type: ignore
 
+    def test_aware_return_dates(self):
+        future = datetime.now(timezone.utc) + timedelta(days=7)
+        req = CheckoutRequest(item_id=1, quantity=1, expected_return_date=future) # type: ignore
+        assert req.expected_return_date == future
+
+        with pytest.raises(ValidationError):
+            CheckoutRequest(
+                item_id=1, quantity=1, expected_return_date=datetime.now(timezone.utc) - timedelta(days=1)
+            ) # type: ignore
+
     def test_notes_optional(self):
         req = CheckoutRequest(item_id=1, quantity=1) # type: ignore
         assert req.notes is None